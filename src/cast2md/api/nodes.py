@@ -383,8 +383,9 @@ def claim_job(
         # Update heartbeat
         node_repo.update_heartbeat(node_id)
 
-        # Get next unclaimed transcription job
-        job = job_repo.get_next_unclaimed_job(JobType.TRANSCRIBE)
+        # Claim the next unclaimed transcription job
+        claimed = job_repo.claim_batch(JobType.TRANSCRIBE, node_id, 1)
+        job = claimed[0] if claimed else None
 
         if not job:
             return ClaimJobResponse(
@@ -395,9 +396,6 @@ def claim_job(
                 has_job=False,
             )
 
-        # Claim the job
-        job_repo.claim_job(job.id, node_id)
-
         # Update node status to busy
         node_repo.update_status(node_id, NodeStatus.BUSY, current_job_id=job.id)
 
@@ -683,8 +681,9 @@ def claim_embed_job(
         # Update heartbeat
         node_repo.update_heartbeat(node_id)
 
-        # Get next unclaimed embed job
-        job = job_repo.get_next_unclaimed_job(JobType.EMBED)
+        # Claim the next unclaimed embed job
+        claimed = job_repo.claim_batch(JobType.EMBED, node_id, 1)
+        job = claimed[0] if claimed else None
 
         if not job:
             return ClaimEmbedJobResponse(
@@ -695,9 +694,6 @@ def claim_embed_job(
                 has_job=False,
             )
 
-        # Claim the job
-        job_repo.claim_job(job.id, node_id)
-
         # Get episode details
         episode = episode_repo.get_by_id(job.episode_id)
 
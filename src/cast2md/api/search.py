@@ -202,7 +202,7 @@ def get_search_stats():
     with get_db() as conn:
         search_repo = TranscriptSearchRepository(conn)
         total_segments = search_repo.get_indexed_count()
-        indexed_episodes = len(search_repo.get_indexed_episodes())
+        indexed_episodes = search_repo.count_indexed_episodes()
 
     return IndexStats(
         total_segments=total_segments,
@@ -405,7 +405,7 @@ def get_semantic_stats():
     with get_db() as conn:
         search_repo = TranscriptSearchRepository(conn)
         total_embeddings = search_repo.get_embedding_count()
-        embedded_episodes = len(search_repo.get_embedded_episodes())
+        embedded_episodes = search_repo.count_embedded_episodes()
 
     return SemanticSearchStats(
         total_embeddings=total_embeddings,
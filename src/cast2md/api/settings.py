@@ -7,6 +7,7 @@ from pydantic import BaseModel
 
 from cast2md.config.settings import (
     NODE_SPECIFIC_SETTINGS,
+    clear_override_cache,
     get_setting_source,
     get_settings,
     reload_settings,
@@ -266,6 +267,7 @@ def update_settings(request: UpdateSettingsRequest):
 
             repo.set(key, str(value))
 
+    clear_override_cache()
     return MessageResponse(message="Settings updated. Some changes require a restart.")
 
 
@@ -280,6 +282,7 @@ def reset_setting(key: str):
         repo = SettingsRepository(conn)
         repo.delete(key)
 
+    clear_override_cache()
     return MessageResponse(message=f"Setting '{key}' reset to default.")
 
 
@@ -292,6 +295,7 @@ def reset_all_settings():
         for key in configurable:
             repo.delete(key)
 
+    clear_override_cache()
     return MessageResponse(message="All settings reset to defaults.")
 
 
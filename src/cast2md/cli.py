@@ -1,9 +1,6 @@
 """Command-line interface for cast2md."""
 
 import os
-import subprocess
-import time
-import webbrowser
 from datetime import datetime
 from pathlib import Path
 
@@ -20,6 +17,17 @@ def cli():
     pass
 
 
+def _looks_like_pg_dump(path: Path) -> bool:
+    """Whether a file starts with the header pg_dump writes in plain format.
+
+    Reads only the first kilobyte, so checking a multi-GB dump costs the same
+    as checking an empty one, and the file is never opened for writing.
+    """
+    with path.open("rb") as f:
+        head = f.read(1024)
+    return b"PostgreSQL database dump" in head
+
+
 @cli.command("init-db")
 def cmd_init_db():
     """Initialize the database."""
@@ -238,6 +246,54 @@ def cmd_transcribe(episode_id: int, timestamps: bool):
         raise SystemExit(1)
 
 
+@cli.command("batch-transcribe")
+@click.argument("episode_ids", nargs=-1, required=True, type=int)
+@click.option("--timestamps", "-t", is_flag=True, help="Include timestamps in output")
+def cmd_batch_transcribe(episode_ids: tuple[int, ...], timestamps: bool):
+    """Transcribe several episodes in one run.
+
+    EPISODE_IDS are the numeric IDs of the episodes, which must be downloaded
+    first. The Whisper model is loaded once and reused for every episode,
+    instead of once per 'cast2md transcribe' invocation.
+    """
+    from cast2md.db.connection import get_db
+    from cast2md.db.repository import EpisodeRepository, FeedRepository
+    from cast2md.transcription.service import transcribe_episode
+
+    with get_db() as conn:
+        episode_repo = EpisodeRepository(conn)
+        feed_repo = FeedRepository(conn)
+        work = []
+        for episode_id in episode_ids:
+            episode = episode_repo.get_by_id(episode_id)
+            if not episode:
+                click.echo(f"Skipping {episode_id}: episode not found", err=True)
+                continue
+            if not episode.audio_path:
+                click.echo(f"Skipping {episode_id}: episode not downloaded", err=True)
+                continue
+            work.append((episode, feed_repo.get_by_id(episode.feed_id)))
+
+    if work:
+        click.echo("Loading Whisper model (this may take a moment)...")
+
+    failed = len(episode_ids) - len(work)
+    for episode, feed in work:
+        click.echo(f"Transcribing: {episode.title}")
+        try:
+            # TranscriptionService is a process-wide singleton, so the model
+            # loaded for the first episode stays in memory for the rest
+            transcript_path = transcribe_episode(episode, feed, include_timestamps=timestamps)
+            click.echo(f"Transcript saved to: {transcript_path}")
+        except Exception as e:
+            click.echo(f"Error transcribing {episode.id}: {e}", err=True)
+            failed += 1
+
+    click.echo(f"Transcribed {len(episode_ids) - failed} of {len(episode_ids)} episodes")
+    if failed:
+        raise SystemExit(1)
+
+
 @cli.command("process")
 @click.argument("episode_id", type=int)
 @click.option("--timestamps", "-t", is_flag=True, help="Include timestamps in output")
@@ -311,7 +367,7 @@ def cmd_status():
             feed_repo = FeedRepository(conn)
             episode_repo = EpisodeRepository(conn)
 
-            feeds = feed_repo.get_all()
+            feed_count = feed_repo.count()
             status_counts = episode_repo.count_by_status()
 
         click.echo("Database: Connected (PostgreSQL)")
@@ -320,17 +376,19 @@ def cmd_status():
         click.echo("Check DATABASE_URL environment variable")
         return
 
-    click.echo(f"Feeds: {len(feeds)}")
+    click.echo(f"Feeds: {feed_count}")
     click.echo()
     click.echo("Episodes by status:")
 
+    # One write for the whole table instead of one per status line
     total = 0
+    lines = []
     for status in EpisodeStatus:
         count = status_counts.get(status.value, 0)
         total += count
-        click.echo(f"  {status.value:<12}: {count}")
-
-    click.echo(f"  {'total':<12}: {total}")
+        lines.append(f"  {status.value:<12}: {count}")
+    lines.append(f"  {'total':<12}: {total}")
+    click.echo("\n".join(lines))
 
     click.echo()
     click.echo("Configuration:")
@@ -349,6 +407,8 @@ def cmd_backup(output: str | None):
 
     Requires pg_dump to be installed and DATABASE_URL to be set.
     """
+    import subprocess
+
     from cast2md.config.settings import get_settings
     from cast2md.db.config import get_database_config
 
@@ -405,7 +465,7 @@ def cmd_backup(output: str | None):
 
 
 @cli.command("restore")
-@click.argument("backup_file", type=click.Path(exists=True))
+@click.argument("backup_file", type=click.Path(exists=True, dir_okay=False))
 @click.option("--force", "-f", is_flag=True, help="Skip confirmation prompt")
 def cmd_restore(backup_file: str, force: bool):
     """Restore database from a backup using psql.
@@ -415,6 +475,8 @@ def cmd_restore(backup_file: str, force: bool):
     WARNING: This will overwrite the current database!
     Requires psql to be installed and DATABASE_URL to be set.
     """
+    import subprocess
+
     from cast2md.config.settings import get_settings
     from cast2md.db.config import get_database_config
 
@@ -424,6 +486,8 @@ def cmd_restore(backup_file: str, force: bool):
     # Validate backup file is a SQL file
     if not backup_path.suffix == ".sql":
         click.echo("Warning: Backup file does not have .sql extension", err=True)
+    if not _looks_like_pg_dump(backup_path):
+        click.echo("Warning: Backup file does not look like a pg_dump SQL dump", err=True)
 
     click.echo(f"Backup file: {backup_path}")
     click.echo(f"Target database: {config.database}@{config.host}")
@@ -505,7 +569,14 @@ def cmd_list_backups():
         click.echo("No backups directory found")
         return
 
-    backups = sorted(backup_dir.glob("cast2md_backup_*.sql"), reverse=True)
+    # Each entry is stat'ed once (cached on the DirEntry)
+    with os.scandir(backup_dir) as it:
+        backups = [
+            entry
+            for entry in it
+            if entry.name.startswith("cast2md_backup_") and entry.name.endswith(".sql")
+        ]
+    backups.sort(key=lambda entry: entry.name, reverse=True)
 
     if not backups:
         click.echo("No backups found")
@@ -515,13 +586,18 @@ def cmd_list_backups():
     click.echo("-" * 75)
 
     for backup in backups:
-        size_mb = backup.stat().st_size / (1024 * 1024)
-        mtime = datetime.fromtimestamp(backup.stat().st_mtime)
+        st = backup.stat()
+        size_mb = st.st_size / (1024 * 1024)
+        mtime = datetime.fromtimestamp(st.st_mtime)
         click.echo(
             f"{backup.name:<45} {size_mb:>8.2f} MB {mtime.strftime('%Y-%m-%d %H:%M:%S'):<20}"
         )
 
 
+# Below this many transcripts, starting worker processes costs more than it saves
+_PARALLEL_PARSE_THRESHOLD = 200
+
+
 @cli.command("reindex-transcripts")
 @click.option("--feed-id", "-f", type=int, help="Only reindex transcripts for this feed")
 @click.option(
@@ -536,8 +612,11 @@ def cmd_reindex_transcripts(feed_id: int | None, embeddings: bool):
     Use --feed-id to limit reindexing to a specific feed.
     Use --embeddings to also regenerate embeddings for semantic search.
     """
+    from concurrent.futures import ProcessPoolExecutor
+
     from cast2md.db.connection import get_db, init_db
     from cast2md.db.repository import EpisodeRepository
+    from cast2md.search.parser import parse_transcript_for_index
     from cast2md.search.repository import TranscriptSearchRepository
 
     init_db()
@@ -555,20 +634,38 @@ def cmd_reindex_transcripts(feed_id: int | None, embeddings: bool):
 
         click.echo(f"Found {len(episode_transcripts)} transcripts to index")
 
-        # Reindex FTS
-        with click.progressbar(
-            episode_transcripts.items(),
-            label="Indexing transcripts (FTS)",
-            length=len(episode_transcripts),
-        ) as items:
-            episodes_indexed = 0
-            segments_indexed = 0
+        # Parsing is pure-Python string work, so large reindexes parse in
+        # worker processes and only the inserts stay on this connection
+        episode_ids = list(episode_transcripts)
+        paths = list(episode_transcripts.values())
+        if len(paths) > _PARALLEL_PARSE_THRESHOLD:
+            executor = ProcessPoolExecutor(max_workers=os.cpu_count())
+            parsed = executor.map(parse_transcript_for_index, paths, chunksize=16)
+        else:
+            executor = None
+            parsed = map(parse_transcript_for_index, paths)
 
-            for episode_id, transcript_path in items:
-                count = search_repo.index_episode(episode_id, transcript_path)
-                if count > 0:
-                    episodes_indexed += 1
-                    segments_indexed += count
+        # Reindex FTS in one transaction: get_db() commits once on exit, and
+        # a failed run rolls back, leaving the previous index in place
+        try:
+            with click.progressbar(
+                zip(episode_ids, parsed),
+                label="Indexing transcripts (FTS)",
+                length=len(episode_transcripts),
+            ) as items:
+                episodes_indexed = 0
+                segments_indexed = 0
+
+                for episode_id, segments in items:
+                    if segments is None:
+                        continue
+                    count = search_repo.index_segments(episode_id, segments, commit=False)
+                    if count > 0:
+                        episodes_indexed += 1
+                        segments_indexed += count
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
 
     click.echo()
     click.echo(f"Indexed {episodes_indexed} episodes with {segments_indexed} segments")
@@ -837,6 +934,8 @@ def cmd_node_start(port: int, no_browser: bool):
     import signal
     import sys
     import threading
+    import time
+    import webbrowser
 
     from cast2md.node.config import load_config
     from cast2md.node.server import run_server
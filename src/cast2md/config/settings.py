@@ -1,24 +1,49 @@
 """Application settings using Pydantic BaseSettings."""
 
+import os
+import time
+from collections.abc import Callable
+from functools import cache, lru_cache
 from pathlib import Path
-from typing import Literal
+from typing import Any, Literal
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from cast2md import __version__
 
-# Build list of env files (later files override earlier ones)
-_env_files = [".env"]
-_node_env = Path.home() / ".cast2md" / ".env"
-if _node_env.exists():
-    _env_files.append(str(_node_env))
+
+@cache
+def _node_env_path() -> Path | None:
+    """Path of the per-user env file written by `cast2md node register`.
+
+    None when CAST2MD_NO_USER_ENV is set, e.g. in CI and test runs that must
+    not pick up a developer's own node config.
+    """
+    if os.environ.get("CAST2MD_NO_USER_ENV"):
+        return None
+    return Path.home() / ".cast2md" / ".env"
+
+
+def _env_files() -> tuple[str, ...]:
+    """List env files to load (later files override earlier ones).
+
+    Resolved when settings are built rather than at import, so importing this
+    module doesn't touch the home directory. Only the path is cached: the
+    node server writes this file and then reloads, so whether it exists is
+    checked on every build.
+    """
+    env_files = [".env"]
+    node_env = _node_env_path()
+    if node_env is not None and node_env.exists():
+        env_files.append(str(node_env))
+    return tuple(env_files)
 
 
 class Settings(BaseSettings):
     """Application configuration with environment variable loading."""
 
     model_config = SettingsConfigDict(
-        env_file=tuple(_env_files),
+        env_file=".env",  # _build_settings passes the full list
         env_file_encoding="utf-8",
         case_sensitive=False,
         extra="ignore",  # Ignore DATABASE_URL and other unrecognized env vars
@@ -113,9 +138,43 @@ class Settings(BaseSettings):
         self.temp_download_path.mkdir(parents=True, exist_ok=True)
 
 
+def _parse_bool(value: str) -> bool:
+    return value.lower() in ("true", "1", "yes")
+
+
+@lru_cache(maxsize=64)
+def _to_path(value: str) -> Path:
+    # Paths are immutable, so reloads can share one instance per stored string
+    return Path(value)
+
+
+def _coercer_for(annotation: Any) -> Callable[[str], Any]:
+    """Pick how a DB string is converted for a field of this type."""
+    # `is`, not issubclass: bool is a subclass of int, and routing bool
+    # settings through int() would turn "false" into a ValueError.
+    if annotation is bool:
+        return _parse_bool
+    if annotation is int:
+        return int
+    if annotation is Path:
+        return _to_path
+    return str
+
+
+# Field name -> DB string coercer, built once from the model's annotations
+_COERCERS: dict[str, Callable[[str], Any]] = {
+    name: _coercer_for(field.annotation) for name, field in Settings.model_fields.items()
+}
+
 # Cached settings instance
 _settings: Settings | None = None
 
+# Last DB overrides read, with the time.monotonic() of the read
+_override_cache: tuple[float, dict[str, str]] | None = None
+
+# How long callers that reload often may reuse the last DB overrides read
+OVERRIDE_TTL_SECONDS = 30.0
+
 
 # Node-specific settings - these come from env file only (not stored in DB).
 # This includes sensitive credentials that shouldn't be in the database.
@@ -168,16 +227,54 @@ _DEFAULTS = {
 }
 
 
+def _build_settings(max_age: float = 0.0) -> Settings:
+    """Load settings from env files and environment, then apply DB overrides."""
+    global _settings
+    _settings = Settings(_env_file=_env_files())
+    _apply_db_overrides(max_age)
+    return _settings
+
+
 def get_settings() -> Settings:
     """Get settings instance, applying database overrides if available."""
-    global _settings
     if _settings is None:
-        _settings = Settings()
-        _apply_db_overrides()
+        return _build_settings()
     return _settings
 
 
-def _apply_db_overrides() -> None:
+def _get_db_overrides(max_age: float) -> dict[str, str]:
+    """Read the settings table, reusing the last read if it is recent enough.
+
+    Args:
+        max_age: Seconds a previous read stays valid; 0 always queries.
+    """
+    global _override_cache
+    now = time.monotonic()
+    if _override_cache_fresh(now, max_age):
+        return _override_cache[1]
+
+    # Only import here to avoid circular imports
+    from cast2md.db.connection import get_db_readonly
+    from cast2md.db.repository import SettingsRepository
+
+    with get_db_readonly() as conn:
+        overrides = SettingsRepository(conn).get_all()
+    _override_cache = (now, overrides)
+    return overrides
+
+
+def _override_cache_fresh(now: float, max_age: float) -> bool:
+    """Whether the last settings-table read is younger than max_age seconds."""
+    return _override_cache is not None and now - _override_cache[0] < max_age
+
+
+def clear_override_cache() -> None:
+    """Forget the cached DB overrides, e.g. after writing the settings table."""
+    global _override_cache
+    _override_cache = None
+
+
+def _apply_db_overrides(max_age: float = 0.0) -> None:
     """Apply settings overrides from database (if available).
 
     All server settings can be configured via the UI and stored in the database.
@@ -193,49 +290,35 @@ def _apply_db_overrides() -> None:
         return
 
     try:
-        # Only import here to avoid circular imports
-        import os
-
-        from cast2md.db.connection import get_db
-        from cast2md.db.repository import SettingsRepository
-
-        with get_db() as conn:
-            repo = SettingsRepository(conn)
-            overrides = repo.get_all()
-
-            for key, value in overrides.items():
-                if not hasattr(_settings, key):
-                    continue
-                # Skip if env var is explicitly set (env wins over DB)
-                if key in NODE_SPECIFIC_SETTINGS or key.upper() in os.environ:
-                    continue
-                current_value = getattr(_settings, key)
-                field_type = type(current_value)
-                try:
-                    # `is`, not isinstance: bool is a subclass of int, so an
-                    # isinstance check would route every bool setting through
-                    # int() and turn "false" into a ValueError.
-                    if field_type is int:
-                        setattr(_settings, key, int(value))
-                    elif field_type is bool:
-                        setattr(_settings, key, value.lower() in ("true", "1", "yes"))
-                    elif isinstance(current_value, Path):
-                        setattr(_settings, key, Path(value))
-                    else:
-                        setattr(_settings, key, value)
-                except (ValueError, TypeError):
-                    pass  # Skip invalid values
+        overrides = _get_db_overrides(max_age)
+
+        for key, value in overrides.items():
+            coerce = _COERCERS.get(key)
+            if coerce is None:
+                continue
+            # Skip if env var is explicitly set (env wins over DB)
+            if key in NODE_SPECIFIC_SETTINGS or key.upper() in os.environ:
+                continue
+            try:
+                setattr(_settings, key, coerce(value))
+            except (ValueError, TypeError):
+                pass  # Skip invalid values
     except Exception:
         # Database might not be initialized yet
         pass
 
 
-def reload_settings() -> Settings:
-    """Force reload of settings (clears cache and reapplies db overrides)."""
-    global _settings
-    _settings = Settings()
-    _apply_db_overrides()
-    return _settings
+def reload_settings(max_age: float = 0.0) -> Settings:
+    """Force reload of settings (clears cache and reapplies db overrides).
+
+    Args:
+        max_age: Reuse the current settings if the DB overrides were read
+            within this many seconds, skipping the env-file parse as well.
+            The default of 0 always rebuilds and re-reads the settings table.
+    """
+    if _settings is not None and _override_cache_fresh(time.monotonic(), max_age):
+        return _settings
+    return _build_settings(max_age)
 
 
 def get_setting_source(key: str, current_value, db_value: str | None) -> str:
@@ -249,8 +332,6 @@ def get_setting_source(key: str, current_value, db_value: str | None) -> str:
     Returns:
         One of: "env_file", "database", "default"
     """
-    import os
-
     # Env vars always win over DB (node-specific or explicitly set)
     env_set = key in NODE_SPECIFIC_SETTINGS or key.upper() in os.environ
     if env_set:
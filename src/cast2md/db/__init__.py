@@ -1,8 +1,32 @@
-"""Database module."""
+"""Database module.
 
-from cast2md.db.connection import get_connection, init_db
-from cast2md.db.models import Episode, EpisodeStatus, Feed, Job, JobStatus, JobType
-from cast2md.db.repository import EpisodeRepository, FeedRepository, JobRepository
+Names are imported on first access (PEP 562), so importing a submodule such
+as cast2md.db.models does not also pull in the connection pool and every
+repository.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from cast2md.db.connection import get_connection, init_db
+    from cast2md.db.models import Episode, EpisodeStatus, Feed, Job, JobStatus, JobType
+    from cast2md.db.repository import EpisodeRepository, FeedRepository, JobRepository
+
+# Public name -> module that defines it
+_LAZY_IMPORTS = {
+    "get_connection": "cast2md.db.connection",
+    "init_db": "cast2md.db.connection",
+    "Feed": "cast2md.db.models",
+    "Episode": "cast2md.db.models",
+    "EpisodeStatus": "cast2md.db.models",
+    "Job": "cast2md.db.models",
+    "JobType": "cast2md.db.models",
+    "JobStatus": "cast2md.db.models",
+    "FeedRepository": "cast2md.db.repository",
+    "EpisodeRepository": "cast2md.db.repository",
+    "JobRepository": "cast2md.db.repository",
+}
 
 __all__ = [
     "get_connection",
@@ -17,3 +41,17 @@ __all__ = [
     "EpisodeRepository",
     "JobRepository",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
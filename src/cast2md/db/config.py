@@ -1,5 +1,6 @@
 """Database configuration for PostgreSQL."""
 
+from functools import cached_property
 from urllib.parse import urlparse
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -24,8 +25,12 @@ class DatabaseConfig(BaseSettings):
     # DATABASE_URL for PostgreSQL connection
     database_url: str | None = None
 
-    # Connection pool settings
-    pool_min_size: int = 2
+    # Connection pool settings. psycopg2 opens pool_min_size connections up
+    # front and closes any connection returned while that many are already
+    # idle, so it is also how many stay warm. It defaults to pool_max_size
+    # so a burst doesn't pay a new connect and pgvector registration per
+    # checkout; lower it to hold fewer idle server connections.
+    pool_min_size: int = 20
     pool_max_size: int = 20
 
     @property
@@ -44,6 +49,12 @@ class DatabaseConfig(BaseSettings):
         Returns:
             Dict with host, port, database, user, password.
         """
+        # A copy, so callers can't alter the cached parse
+        return dict(self._postgres_params)
+
+    @cached_property
+    def _postgres_params(self) -> dict:
+        """The URL parsed once per config instance."""
         parsed = urlparse(self.effective_url)
         return {
             "host": parsed.hostname or "localhost",
@@ -1,8 +1,11 @@
 """Database connection management for PostgreSQL."""
 
+import importlib.util
 import logging
+import weakref
 from collections.abc import Generator
 from contextlib import contextmanager
+from functools import cache
 from typing import Any, Protocol
 
 from cast2md.db.config import get_db_config
@@ -15,7 +18,9 @@ Connection = Any
 # PostgreSQL connection pool (lazy-initialized)
 _pg_pool: Any = None
 _pg_pool_initialized: bool = False
-_pgvector_registered_conns: set = set()
+# Connections with pgvector types registered. Weak, so a connection the pool
+# discards drops out instead of a new one being mistaken for it by id().
+_pgvector_registered_conns: weakref.WeakSet = weakref.WeakSet()
 
 
 class DatabaseConnection(Protocol):
@@ -32,15 +37,13 @@ class DatabaseConnection(Protocol):
 def is_pgvector_available() -> bool:
     """Check if pgvector is available for PostgreSQL.
 
+    True only if the psycopg2 adapter actually imports, so callers agree
+    with what connection registration can do. The import is cached.
+
     Returns:
-        True if pgvector Python bindings are installed.
+        True if pgvector Python bindings are installed and importable.
     """
-    try:
-        import pgvector  # noqa: F401
-
-        return True
-    except ImportError:
-        return False
+    return _load_register_vector() is not None
 
 
 def _init_pg_pool() -> Any:
@@ -87,20 +90,69 @@ def _init_pg_pool() -> Any:
 
 def _register_pgvector() -> None:
     """Register pgvector types with psycopg2."""
+    if not is_pgvector_available():
+        logger.warning("pgvector not available, vector search will be unavailable")
+        return
+
+    # Get a connection from pool to register types
+    conn = _pg_pool.getconn()
+    try:
+        if _register_pgvector_on(conn):
+            logger.info("pgvector types registered successfully")
+        else:
+            logger.warning("Failed to register pgvector types, is the extension created?")
+    finally:
+        _pg_pool.putconn(conn)
+
+
+@cache
+def _load_register_vector() -> Any:
+    """Import pgvector's psycopg2 adapter, once.
+
+    find_spec only shows the package is installed; importing it can still
+    fail (e.g. numpy missing), in which case vector support is left off.
+
+    Returns:
+        register_vector, or None if pgvector is missing or can't be imported.
+    """
+    if importlib.util.find_spec("pgvector") is None:
+        return None
     try:
         from pgvector.psycopg2 import register_vector
+    except ImportError as e:
+        logger.warning(f"pgvector installed but not importable, vector search disabled: {e}")
+        return None
+    return register_vector
 
-        # Get a connection from pool to register types
-        conn = _pg_pool.getconn()
-        try:
-            register_vector(conn)
-            logger.info("pgvector types registered successfully")
-        finally:
-            _pg_pool.putconn(conn)
-    except ImportError:
-        logger.warning("pgvector not installed, vector search will be unavailable")
+
+def _register_pgvector_on(conn: Any) -> bool:
+    """Register pgvector types on one connection, once per connection.
+
+    register_vector costs a round trip to look up the vector type's OID, so
+    it runs the first time a physical connection is checked out, not on
+    every checkout.
+
+    Returns:
+        True if the connection has the types registered.
+    """
+    if conn in _pgvector_registered_conns:
+        return True
+    register_vector = _load_register_vector()
+    if register_vector is None:
+        return False
+
+    try:
+        register_vector(conn)
     except Exception as e:
-        logger.warning(f"Failed to register pgvector types: {e}")
+        logger.debug(f"Failed to register pgvector types: {e}")
+        # The failed lookup aborts the transaction; don't hand that to the caller
+        conn.rollback()
+        return False
+    # The type lookup left a transaction open; close it so the caller gets an
+    # idle connection (get_db_readonly can't set READ ONLY inside one)
+    conn.rollback()
+    _pgvector_registered_conns.add(conn)
+    return True
 
 
 def _get_pg_connection() -> Any:
@@ -111,18 +163,12 @@ def _get_pg_connection() -> Any:
     """
     pool = _init_pg_pool()
     conn = pool.getconn()
-
-    # Register pgvector once per connection (avoid repeated pg_type queries)
-    conn_id = id(conn)
-    if conn_id not in _pgvector_registered_conns:
-        try:
-            from pgvector.psycopg2 import register_vector
-
-            register_vector(conn)
-            _pgvector_registered_conns.add(conn_id)
-        except (ImportError, Exception):
-            pass
-
+    # An idle connection the server dropped is only noticed once used;
+    # one psycopg2 has already marked closed is replaced here for free
+    while conn.closed:
+        pool.putconn(conn, close=True)
+        conn = pool.getconn()
+    _register_pgvector_on(conn)
     return conn
 
 
@@ -167,6 +213,31 @@ def get_db() -> Generator[Connection, None, None]:
 get_db_write = get_db
 
 
+@contextmanager
+def get_db_readonly() -> Generator[Connection, None, None]:
+    """Context manager for connections that only read.
+
+    Uses the same pool as get_db, with the transaction opened READ ONLY: a
+    stray write fails instead of committing, and the transaction ends with a
+    rollback since there is nothing to commit. psycopg2 puts READ ONLY on
+    the BEGIN it already sends, so this costs no extra round trip.
+
+    Yields:
+        Database connection in a read-only transaction.
+    """
+    conn = _get_pg_connection()
+    try:
+        conn.readonly = True
+        yield conn
+    finally:
+        try:
+            conn.rollback()
+            # Back to the server default before other callers get it
+            conn.readonly = None
+        finally:
+            _return_pg_connection(conn)
+
+
 def init_db() -> None:
     """Initialize the database with schema and run migrations."""
     from cast2md.db.migrations import run_migrations
@@ -175,28 +246,40 @@ def init_db() -> None:
     with get_db() as conn:
         cursor = conn.cursor()
 
-        # Enable pgvector extension
-        try:
-            cursor.execute("CREATE EXTENSION IF NOT EXISTS vector")
-            conn.commit()
-            logger.info("pgvector extension enabled")
-        except Exception as e:
-            logger.warning(f"Could not enable pgvector extension: {e}")
-            conn.rollback()
+        # Don't wait for a WAL flush on each of the commits below. Every step
+        # is idempotent, so a crash that loses the last commits just means
+        # the next startup redoes them. Session-level, hence the RESET.
+        cursor.execute("SET synchronous_commit TO OFF")
+        conn.commit()
 
-        # Create tables
-        for statement in get_schema():
+        try:
+            # Enable pgvector extension
             try:
-                cursor.execute(statement)
+                cursor.execute("CREATE EXTENSION IF NOT EXISTS vector")
+                conn.commit()
+                logger.info("pgvector extension enabled")
             except Exception as e:
-                logger.warning(f"Schema statement failed: {e}")
+                logger.warning(f"Could not enable pgvector extension: {e}")
                 conn.rollback()
-                continue
 
-        conn.commit()
+            # Create tables
+            for statement in get_schema():
+                try:
+                    cursor.execute(statement)
+                except Exception as e:
+                    logger.warning(f"Schema statement failed: {e}")
+                    conn.rollback()
+                    continue
+
+            conn.commit()
 
-        # Run migrations
-        run_migrations(conn)
+            # Run migrations
+            run_migrations(conn)
+        finally:
+            # The connection goes back to the pool for ordinary writes
+            conn.rollback()
+            cursor.execute("RESET synchronous_commit")
+            conn.commit()
 
 
 def ping() -> None:
@@ -206,7 +289,7 @@ def ping() -> None:
     here rather than on a repository. Propagates the driver's exception rather
     than returning a bool, so a caller can report why the check failed.
     """
-    with get_db() as conn:
+    with get_db_readonly() as conn:
         cursor = conn.cursor()
         cursor.execute("SELECT 1")
         cursor.fetchone()
@@ -1,30 +1,48 @@
 """PostgreSQL database migrations for schema changes."""
 
 import logging
+from bisect import bisect_right
+from dataclasses import dataclass
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
-# Database migrations - these run after initial schema creation
-MIGRATIONS: list[dict] = [
+
+@dataclass(frozen=True, slots=True)
+class Migration:
+    """One schema version: the statements that take the schema to it."""
+
+    version: int
+    description: str
+    sql: tuple[str, ...]
+
+
+# Database migrations - these run after initial schema creation, in version order
+MIGRATIONS: tuple[Migration, ...] = (
     # Initial schema is version 10
     # Future migrations go here as the schema evolves
-    {
-        "version": 11,
-        "description": "Rename episode status values for improved UX",
-        "sql": [
-            "UPDATE episode SET status = 'new' WHERE status = 'pending'",
-            "UPDATE episode SET status = 'awaiting_transcript' WHERE status = 'transcript_pending'",
-            "UPDATE episode SET status = 'needs_audio' WHERE status = 'transcript_unavailable'",
-            "UPDATE episode SET status = 'audio_ready' WHERE status = 'downloaded'",
+    Migration(
+        version=11,
+        description="Rename episode status values for improved UX",
+        sql=(
+            # One pass over episode rather than one UPDATE per renamed value
+            """
+            UPDATE episode SET status = CASE status
+                WHEN 'pending' THEN 'new'
+                WHEN 'transcript_pending' THEN 'awaiting_transcript'
+                WHEN 'transcript_unavailable' THEN 'needs_audio'
+                WHEN 'downloaded' THEN 'audio_ready'
+            END
+            WHERE status IN ('pending', 'transcript_pending', 'transcript_unavailable', 'downloaded')
+            """,
             # Also update the default value for the column
             "ALTER TABLE episode ALTER COLUMN status SET DEFAULT 'new'",
-        ],
-    },
-    {
-        "version": 12,
-        "description": "Add pod_runs table for RunPod cost tracking",
-        "sql": [
+        ),
+    ),
+    Migration(
+        version=12,
+        description="Add pod_runs table for RunPod cost tracking",
+        sql=(
             """
             CREATE TABLE IF NOT EXISTS pod_runs (
                 id SERIAL PRIMARY KEY,
@@ -42,12 +60,12 @@ MIGRATIONS: list[dict] = [
             """,
             "CREATE INDEX IF NOT EXISTS idx_pod_runs_status ON pod_runs(status)",
             "CREATE INDEX IF NOT EXISTS idx_pod_runs_started_at ON pod_runs(started_at)",
-        ],
-    },
-    {
-        "version": 13,
-        "description": "Add runpod_models table for customizable pod transcription models",
-        "sql": [
+        ),
+    ),
+    Migration(
+        version=13,
+        description="Add runpod_models table for customizable pod transcription models",
+        sql=(
             """
             CREATE TABLE IF NOT EXISTS runpod_models (
                 id TEXT PRIMARY KEY,
@@ -58,12 +76,12 @@ MIGRATIONS: list[dict] = [
                 created_at TIMESTAMP NOT NULL DEFAULT NOW()
             )
             """,
-        ],
-    },
-    {
-        "version": 14,
-        "description": "Add pod_setup_states table for persistent pod tracking",
-        "sql": [
+        ),
+    ),
+    Migration(
+        version=14,
+        description="Add pod_setup_states table for persistent pod tracking",
+        sql=(
             """
             CREATE TABLE IF NOT EXISTS pod_setup_states (
                 instance_id TEXT PRIMARY KEY,
@@ -82,12 +100,12 @@ MIGRATIONS: list[dict] = [
                 updated_at TIMESTAMP NOT NULL DEFAULT NOW()
             )
             """,
-        ],
-    },
-    {
-        "version": 15,
-        "description": "Fix job retry system: raise max_attempts to 10, add permanent_failure column, reset bugged retry counts",
-        "sql": [
+        ),
+    ),
+    Migration(
+        version=15,
+        description="Fix job retry system: raise max_attempts to 10, add permanent_failure column, reset bugged retry counts",
+        sql=(
             # Add permanent_failure column to episode table
             "ALTER TABLE episode ADD COLUMN IF NOT EXISTS permanent_failure BOOLEAN DEFAULT FALSE",
             # Raise default max_attempts from 3 to 10
@@ -108,65 +126,66 @@ MIGRATIONS: list[dict] = [
                 WHERE job_type = 'transcribe' AND status = 'queued' AND attempts = 0
             ) AND status = 'failed'
             """,
-        ],
-    },
-    {
-        "version": 16,
-        "description": "Rewrite storage paths from bare-metal to Docker container paths",
-        "sql": [
-            # Transcript paths
+        ),
+    ),
+    Migration(
+        version=16,
+        description="Rewrite storage paths from bare-metal to Docker container paths",
+        sql=(
+            # Transcript and audio paths in one pass; REPLACE is a no-op on
+            # the column that doesn't match
             """
             UPDATE episode
-            SET transcript_path = REPLACE(transcript_path, '/mnt/nas/cast2md/', '/app/data/podcasts/')
+            SET transcript_path = REPLACE(transcript_path, '/mnt/nas/cast2md/', '/app/data/podcasts/'),
+                audio_path = REPLACE(audio_path, '/mnt/nas/cast2md/', '/app/data/podcasts/')
             WHERE transcript_path LIKE '/mnt/nas/cast2md/%'
+               OR audio_path LIKE '/mnt/nas/cast2md/%'
             """,
-            # Audio paths
-            """
-            UPDATE episode
-            SET audio_path = REPLACE(audio_path, '/mnt/nas/cast2md/', '/app/data/podcasts/')
-            WHERE audio_path LIKE '/mnt/nas/cast2md/%'
-            """,
-        ],
-    },
-    {
-        "version": 17,
-        "description": "Add setup_token column to pod_setup_states for pod self-setup authentication",
-        "sql": [
-            "ALTER TABLE pod_setup_states ADD COLUMN IF NOT EXISTS setup_token TEXT DEFAULT ''",
-        ],
-    },
-    {
-        "version": 18,
-        "description": "Add unique partial index to prevent duplicate active jobs per episode",
-        "sql": [
+        ),
+    ),
+    Migration(
+        version=17,
+        description="Add setup_token column to pod_setup_states for pod self-setup authentication",
+        sql=("ALTER TABLE pod_setup_states ADD COLUMN IF NOT EXISTS setup_token TEXT DEFAULT ''",),
+    ),
+    Migration(
+        version=18,
+        description="Add unique partial index to prevent duplicate active jobs per episode",
+        sql=(
             """
             CREATE UNIQUE INDEX IF NOT EXISTS idx_job_queue_episode_type_active
             ON job_queue (episode_id, job_type)
             WHERE status IN ('queued', 'running')
             """,
-        ],
-    },
-]
+        ),
+    ),
+    Migration(
+        version=19,
+        description="Drop idx_episode_feed_id, covered by idx_episode_feed_published",
+        sql=("DROP INDEX IF EXISTS idx_episode_feed_id",),
+    ),
+)
+
+# Versions in MIGRATIONS, for finding the first pending migration by bisection
+_VERSIONS = [migration.version for migration in MIGRATIONS]
+assert _VERSIONS == sorted(_VERSIONS), "MIGRATIONS must be in version order"
+_MAX_VERSION = _VERSIONS[-1]
 
 
 def get_schema_version(conn: Any) -> int:
     """Get the current schema version from the database.
 
-    Returns 0 if no migrations have been run.
+    Returns 0 if no migrations have been run, or if the schema_version table
+    doesn't exist yet.
     """
     cursor = conn.cursor()
     try:
-        cursor.execute(
-            "SELECT EXISTS (SELECT FROM information_schema.tables WHERE table_name = 'schema_version')"
-        )
-        exists = cursor.fetchone()[0]
-        if not exists:
-            return 0
-
-        cursor.execute("SELECT version FROM schema_version ORDER BY version DESC LIMIT 1")
+        cursor.execute("SELECT MAX(version) FROM schema_version")
         row = cursor.fetchone()
-        return row[0] if row else 0
+        return row[0] or 0
     except Exception:
+        # Missing table: clear the aborted transaction for the caller
+        conn.rollback()
         return 0
 
 
@@ -214,20 +233,13 @@ def run_migrations(conn: Any) -> int:
 
     Returns the number of migrations applied.
     """
-    # Ensure schema_version table exists
-    cursor = conn.cursor()
-    cursor.execute(
-        """
-        CREATE TABLE IF NOT EXISTS schema_version (
-            version INTEGER PRIMARY KEY,
-            applied_at TIMESTAMP NOT NULL DEFAULT NOW()
-        )
-        """
-    )
-    conn.commit()
-
+    # schema_version is created with the rest of the schema by init_db
     current_version = get_schema_version(conn)
 
+    # Already up to date: the common case on every startup
+    if current_version >= _MAX_VERSION:
+        return 0
+
     # If this is a fresh install, set version to 10
     if current_version == 0:
         set_schema_version(conn, 10)
@@ -235,18 +247,16 @@ def run_migrations(conn: Any) -> int:
         logger.info("Initialized database schema at version 10")
         return 0
 
+    cursor = conn.cursor()
     migrations_applied = 0
 
-    for migration in MIGRATIONS:
-        version = migration["version"]
-        if version <= current_version:
-            continue
-
-        logger.info(f"Applying migration {version}: {migration['description']}")
+    for migration in MIGRATIONS[bisect_right(_VERSIONS, current_version) :]:
+        version = migration.version
+        logger.info(f"Applying migration {version}: {migration.description}")
 
         try:
-            for sql in migration["sql"]:
-                cursor.execute(sql)
+            # One round trip per version; the statements take no parameters
+            cursor.execute(";\n".join(migration.sql))
 
             set_schema_version(conn, version)
             conn.commit()
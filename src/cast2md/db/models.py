@@ -1,9 +1,12 @@
 """Data models for the database layer."""
 
+from __future__ import annotations
+
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from enum import Enum
+from enum import StrEnum
+from typing import Self
 
 
 def parse_datetime(value) -> datetime | None:
@@ -26,7 +29,7 @@ def parse_datetime(value) -> datetime | None:
     return None
 
 
-class EpisodeStatus(str, Enum):
+class EpisodeStatus(StrEnum):
     """Episode processing status."""
 
     NEW = "new"  # Just discovered, ready to process
@@ -39,7 +42,7 @@ class EpisodeStatus(str, Enum):
     FAILED = "failed"
 
 
-class JobType(str, Enum):
+class JobType(StrEnum):
     """Job type for queue."""
 
     DOWNLOAD = "download"
@@ -48,7 +51,7 @@ class JobType(str, Enum):
     EMBED = "embed"
 
 
-class JobStatus(str, Enum):
+class JobStatus(StrEnum):
     """Job status in queue."""
 
     QUEUED = "queued"
@@ -57,7 +60,7 @@ class JobStatus(str, Enum):
     FAILED = "failed"
 
 
-class NodeStatus(str, Enum):
+class NodeStatus(StrEnum):
     """Transcriber node status."""
 
     ONLINE = "online"
@@ -65,8 +68,28 @@ class NodeStatus(str, Enum):
     BUSY = "busy"
 
 
-@dataclass
-class Feed:
+# Value -> member tables for from_row. Rows always hold valid values, so a
+# dict lookup replaces the Enum constructor's checks on every row.
+_EPISODE_STATUSES = {status.value: status for status in EpisodeStatus}
+_JOB_TYPES = {job_type.value: job_type for job_type in JobType}
+_JOB_STATUSES = {status.value: status for status in JobStatus}
+_NODE_STATUSES = {status.value: status for status in NodeStatus}
+
+
+class _RowModel:
+    """Shared constructors for models built from database rows."""
+
+    __slots__ = ()
+
+    @classmethod
+    def from_rows(cls, rows: list[tuple]) -> list[Self]:
+        """Create models from a list of database rows."""
+        from_row = cls.from_row
+        return [from_row(row) for row in rows]
+
+
+@dataclass(slots=True)
+class Feed(_RowModel):
     """Podcast feed model."""
 
     id: int | None
@@ -83,6 +106,10 @@ class Feed:
     pocketcasts_uuid: str | None
     created_at: datetime
     updated_at: datetime
+    # (categories, parsed list) from the last category_list call
+    _category_cache: tuple[str, list[str]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @property
     def display_title(self) -> str:
@@ -91,16 +118,21 @@ class Feed:
 
     @property
     def category_list(self) -> list[str]:
-        """Parse categories JSON to list."""
+        """Parse categories JSON to list, once per categories value."""
         if not self.categories:
             return []
+        cache = self._category_cache
+        if cache is not None and cache[0] == self.categories:
+            return cache[1]
         try:
-            return json.loads(self.categories)
+            parsed = json.loads(self.categories)
         except (json.JSONDecodeError, TypeError):
-            return []
+            parsed = []
+        self._category_cache = (self.categories, parsed)
+        return parsed
 
     @classmethod
-    def from_row(cls, row: tuple) -> "Feed":
+    def from_row(cls, row: tuple) -> Feed:
         """Create Feed from database row."""
         return cls(
             id=row[0],
@@ -120,8 +152,8 @@ class Feed:
         )
 
 
-@dataclass
-class Episode:
+@dataclass(slots=True)
+class Episode(_RowModel):
     """Podcast episode model."""
 
     id: int | None
@@ -151,7 +183,7 @@ class Episode:
     updated_at: datetime
 
     @classmethod
-    def from_row(cls, row: tuple) -> "Episode":
+    def from_row(cls, row: tuple) -> Episode:
         """Create Episode from database row."""
         return cls(
             id=row[0],
@@ -162,7 +194,7 @@ class Episode:
             audio_url=row[5],
             duration_seconds=row[6],
             published_at=parse_datetime(row[7]),
-            status=EpisodeStatus(row[8]),
+            status=_EPISODE_STATUSES[row[8]],
             audio_path=row[9],
             transcript_path=row[10],
             transcript_url=row[11],
@@ -182,8 +214,8 @@ class Episode:
         )
 
 
-@dataclass
-class Job:
+@dataclass(slots=True)
+class Job(_RowModel):
     """Job queue entry."""
 
     id: int | None
@@ -217,14 +249,14 @@ class Job:
         return self.started_at < datetime.now() - timedelta(minutes=threshold_minutes)
 
     @classmethod
-    def from_row(cls, row: tuple) -> "Job":
+    def from_row(cls, row: tuple) -> Job:
         """Create Job from database row."""
         return cls(
             id=row[0],
             episode_id=row[1],
-            job_type=JobType(row[2]),
+            job_type=_JOB_TYPES[row[2]],
             priority=row[3],
-            status=JobStatus(row[4]),
+            status=_JOB_STATUSES[row[4]],
             attempts=row[5],
             max_attempts=row[6],
             scheduled_at=parse_datetime(row[7]) or datetime.now(),
@@ -239,8 +271,8 @@ class Job:
         )
 
 
-@dataclass
-class TranscriberNode:
+@dataclass(slots=True)
+class TranscriberNode(_RowModel):
     """Remote transcriber node."""
 
     id: str
@@ -257,7 +289,7 @@ class TranscriberNode:
     updated_at: datetime
 
     @classmethod
-    def from_row(cls, row: tuple) -> "TranscriberNode":
+    def from_row(cls, row: tuple) -> TranscriberNode:
         """Create TranscriberNode from database row."""
         return cls(
             id=row[0],
@@ -266,7 +298,7 @@ class TranscriberNode:
             api_key=row[3],
             whisper_model=row[4],
             whisper_backend=row[5],
-            status=NodeStatus(row[6]) if row[6] else NodeStatus.OFFLINE,
+            status=_NODE_STATUSES[row[6]] if row[6] else NodeStatus.OFFLINE,
             last_heartbeat=parse_datetime(row[7]),
             current_job_id=row[8],
             priority=row[9] if row[9] is not None else 10,
@@ -1,12 +1,16 @@
 """Repository for podcast episodes."""
 
+from collections.abc import Iterator, Sequence
 from datetime import datetime, timedelta
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from cast2md.db.models import Episode, EpisodeStatus
-from cast2md.db.sql import Connection, execute
+from cast2md.db.sql import Connection, execute, placeholders
 from cast2md.db.tsquery import build_flexible_tsquery
 
+if TYPE_CHECKING:
+    from cast2md.feed.parser import ParsedEpisode
+
 
 class EpisodeRepository:
     """Repository for Episode CRUD operations."""
@@ -19,6 +23,10 @@ class EpisodeRepository:
                          transcript_failure_reason, link, author,
                          error_message, permanent_failure, created_at, updated_at"""
 
+    # Point lookups, built once rather than formatted on every call
+    _SELECT_BY_ID = f"SELECT {EPISODE_COLUMNS} FROM episode WHERE id = %s"
+    _SELECT_BY_GUID = f"SELECT {EPISODE_COLUMNS} FROM episode WHERE feed_id = %s AND guid = %s"
+
     def __init__(self, conn: Connection):
         self.conn = conn
 
@@ -41,15 +49,16 @@ class EpisodeRepository:
         published_str = published_at.isoformat() if published_at else None
 
         cursor = self.conn.cursor()
+        # RETURNING the full row saves a get_by_id round trip afterwards
         cursor.execute(
-            """
+            f"""
             INSERT INTO episode (
                 feed_id, guid, title, description, audio_url,
                 duration_seconds, published_at, status, transcript_url,
                 transcript_type, link, author, created_at, updated_at
             )
             VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            RETURNING id
+            RETURNING {self.EPISODE_COLUMNS}
             """,
             (
                 feed_id,
@@ -68,7 +77,8 @@ class EpisodeRepository:
                 now,
             ),
         )
-        episode_id = cursor.fetchone()[0]
+        episode = Episode.from_row(cursor.fetchone())
+        episode_id = episode.id
 
         # Index in PostgreSQL FTS table
         cursor.execute(
@@ -80,13 +90,91 @@ class EpisodeRepository:
         )
 
         self.conn.commit()
-        return self.get_by_id(episode_id)
+        return episode
+
+    def create_many(self, feed_id: int, parsed: Sequence["ParsedEpisode"]) -> list[Episode]:
+        """Create episodes from a feed poll, skipping GUIDs the feed already has.
+
+        Inserts the episodes and their FTS rows with one multi-row statement
+        each and commits once, instead of an exists() check and a create()
+        per episode.
+
+        Args:
+            feed_id: Feed the episodes belong to.
+            parsed: Episodes as parsed from the RSS feed.
+
+        Returns:
+            The newly created episodes, in the order they appear in parsed.
+        """
+        from psycopg2.extras import execute_values
+
+        if not parsed:
+            return []
+
+        now = datetime.now().isoformat()
+        cursor = self.conn.cursor()
+        # ON CONFLICT skips both known GUIDs and repeats within this poll
+        rows = execute_values(
+            cursor,
+            f"""
+            INSERT INTO episode (
+                feed_id, guid, title, description, audio_url,
+                duration_seconds, published_at, status, transcript_url,
+                transcript_type, link, author, created_at, updated_at
+            )
+            VALUES %s
+            ON CONFLICT (feed_id, guid) DO NOTHING
+            RETURNING {self.EPISODE_COLUMNS}
+            """,
+            [
+                (
+                    feed_id,
+                    ep.guid,
+                    ep.title,
+                    ep.description,
+                    ep.audio_url,
+                    ep.duration_seconds,
+                    ep.published_at.isoformat() if ep.published_at else None,
+                    EpisodeStatus.NEW.value,
+                    ep.transcript_url,
+                    ep.transcript_type,
+                    ep.link,
+                    ep.author,
+                    now,
+                    now,
+                )
+                for ep in parsed
+            ],
+            fetch=True,
+        )
+        if not rows:
+            self.conn.commit()
+            return []
+
+        # RETURNING order is not guaranteed; restore the feed's order
+        position = {}
+        for i, ep in enumerate(parsed):
+            position.setdefault(ep.guid, i)
+        episodes = sorted(Episode.from_rows(rows), key=lambda e: position[e.guid])
+
+        execute_values(
+            cursor,
+            """
+            INSERT INTO episode_search (episode_id, feed_id, title_search, description_search)
+            VALUES %s
+            """,
+            [(e.id, feed_id, e.title, e.description or "") for e in episodes],
+            template="(%s, %s, to_tsvector('english', %s), to_tsvector('english', %s))",
+        )
+
+        self.conn.commit()
+        return episodes
 
     def get_by_id(self, episode_id: int) -> Episode | None:
         """Get episode by ID."""
         cursor = execute(
             self.conn,
-            f"SELECT {self.EPISODE_COLUMNS} FROM episode WHERE id = %s",
+            self._SELECT_BY_ID,
             (episode_id,),
         )
         row = cursor.fetchone()
@@ -109,20 +197,20 @@ class EpisodeRepository:
             return {}
 
         unique_ids = list(set(episode_ids))
-        placeholders = ", ".join(["%s"] * len(unique_ids))
+        in_list = placeholders(len(unique_ids))
         cursor = execute(
             self.conn,
-            f"SELECT {self.EPISODE_COLUMNS} FROM episode WHERE id IN ({placeholders})",
+            f"SELECT {self.EPISODE_COLUMNS} FROM episode WHERE id IN ({in_list})",
             tuple(unique_ids),
         )
-        episodes = [Episode.from_row(row) for row in cursor.fetchall()]
+        episodes = Episode.from_rows(cursor.fetchall())
         return {ep.id: ep for ep in episodes}
 
     def get_by_guid(self, feed_id: int, guid: str) -> Episode | None:
         """Get episode by feed ID and GUID."""
         cursor = execute(
             self.conn,
-            f"SELECT {self.EPISODE_COLUMNS} FROM episode WHERE feed_id = %s AND guid = %s",
+            self._SELECT_BY_GUID,
             (feed_id, guid),
         )
         row = cursor.fetchone()
@@ -140,7 +228,7 @@ class EpisodeRepository:
             """,
             (feed_id, limit),
         )
-        return [Episode.from_row(row) for row in cursor.fetchall()]
+        return Episode.from_rows(cursor.fetchall())
 
     def get_transcript_paths(self, feed_id: int | None = None) -> dict[int, str]:
         """Map episode ID to transcript path for completed episodes with a transcript.
@@ -184,7 +272,7 @@ class EpisodeRepository:
             """,
             (feed_id, limit, offset),
         )
-        return [Episode.from_row(row) for row in cursor.fetchall()]
+        return Episode.from_rows(cursor.fetchall())
 
     # Sort orders accepted by get_by_status. Keys are the public API values,
     # values the SQL fragment — the mapping is what keeps the ORDER BY clause
@@ -214,6 +302,35 @@ class EpisodeRepository:
             feed_id: Restrict the result to a single feed.
             order: One of STATUS_ORDERS. Unknown values raise ValueError.
         """
+        cursor = self._select_by_status(status, limit, since, feed_id, order)
+        return Episode.from_rows(cursor.fetchall())
+
+    def iter_by_status(
+        self,
+        status: EpisodeStatus,
+        limit: int = 100,
+        since: str | None = None,
+        feed_id: int | None = None,
+        order: str = "created_asc",
+    ) -> Iterator[Episode]:
+        """Like get_by_status, but build each Episode only as it is consumed.
+
+        The query runs immediately and the client-side cursor holds every
+        row; only the Episode construction is deferred, so no list of models
+        is built up front.
+        """
+        cursor = self._select_by_status(status, limit, since, feed_id, order)
+        return map(Episode.from_row, cursor)
+
+    def _select_by_status(
+        self,
+        status: EpisodeStatus,
+        limit: int,
+        since: str | None,
+        feed_id: int | None,
+        order: str,
+    ) -> Any:
+        """Run the query behind get_by_status and iter_by_status."""
         if order not in self.STATUS_ORDERS:
             raise ValueError(f"Invalid order: {order}. Valid options: {sorted(self.STATUS_ORDERS)}")
 
@@ -238,7 +355,7 @@ class EpisodeRepository:
             """,
             tuple(params),
         )
-        return [Episode.from_row(row) for row in cursor.fetchall()]
+        return cursor
 
     def update_status(
         self,
@@ -456,7 +573,7 @@ class EpisodeRepository:
             """,
             (EpisodeStatus.AWAITING_TRANSCRIPT.value, now),
         )
-        return [Episode.from_row(row) for row in cursor.fetchall()]
+        return Episode.from_rows(cursor.fetchall())
 
     def get_status_counts_for_feed(self, feed_id: int) -> dict[str, int]:
         """Get episode counts by status for a feed.
@@ -473,7 +590,7 @@ class EpisodeRepository:
             """,
             (feed_id,),
         )
-        return dict(cursor.fetchall())
+        return dict(cursor)
 
     def get_retranscribable_episodes(self, feed_id: int, current_model: str) -> list[Episode]:
         """Get completed episodes where transcript_model differs from current model.
@@ -496,7 +613,7 @@ class EpisodeRepository:
             """,
             (feed_id, EpisodeStatus.COMPLETED.value, current_model),
         )
-        return [Episode.from_row(row) for row in cursor.fetchall()]
+        return Episode.from_rows(cursor.fetchall())
 
     def count_retranscribable_episodes(self, feed_id: int, current_model: str) -> int:
         """Count completed episodes where transcript_model differs from current model.
@@ -537,46 +654,39 @@ class EpisodeRepository:
             Number of episodes updated.
         """
         now = datetime.now().isoformat()
+        old_part, new_part = f"/{old_dir_name}/", f"/{new_dir_name}/"
+        pattern = f"%/{old_dir_name}/%"
 
-        # Update audio_path
-        cursor = execute(
-            self.conn,
-            """
-            UPDATE episode
-            SET audio_path = REPLACE(audio_path, %s, %s),
-                updated_at = %s
-            WHERE feed_id = %s AND audio_path IS NOT NULL AND audio_path LIKE %s
-            """,
-            (
-                f"/{old_dir_name}/",
-                f"/{new_dir_name}/",
-                now,
-                feed_id,
-                f"%/{old_dir_name}/%",
-            ),
-        )
-        audio_updated = cursor.rowcount
-
-        # Update transcript_path
+        # One pass over the feed's episodes; each path is rewritten only if it
+        # contains the old directory (NULL paths never match LIKE)
         cursor = execute(
             self.conn,
             """
             UPDATE episode
-            SET transcript_path = REPLACE(transcript_path, %s, %s),
+            SET audio_path = CASE WHEN audio_path LIKE %s
+                                  THEN REPLACE(audio_path, %s, %s) ELSE audio_path END,
+                transcript_path = CASE WHEN transcript_path LIKE %s
+                                       THEN REPLACE(transcript_path, %s, %s)
+                                       ELSE transcript_path END,
                 updated_at = %s
-            WHERE feed_id = %s AND transcript_path IS NOT NULL AND transcript_path LIKE %s
+            WHERE feed_id = %s AND (audio_path LIKE %s OR transcript_path LIKE %s)
             """,
             (
-                f"/{old_dir_name}/",
-                f"/{new_dir_name}/",
+                pattern,
+                old_part,
+                new_part,
+                pattern,
+                old_part,
+                new_part,
                 now,
                 feed_id,
-                f"%/{old_dir_name}/%",
+                pattern,
+                pattern,
             ),
         )
 
         self.conn.commit()
-        return max(audio_updated, cursor.rowcount)
+        return cursor.rowcount
 
     def exists(self, feed_id: int, guid: str) -> bool:
         """Check if episode already exists."""
@@ -634,35 +744,24 @@ class EpisodeRepository:
             - pocketcasts: Episodes with pocketcasts_transcript_url (no Podcast 2.0)
             - whisper_only: Episodes with neither (need Whisper transcription)
         """
-        # Count episodes with Podcast 2.0 transcript URLs
-        cursor = execute(
-            self.conn,
-            "SELECT COUNT(*) FROM episode WHERE feed_id = %s AND transcript_url IS NOT NULL",
-            (feed_id,),
-        )
-        podcast20_count = cursor.fetchone()[0]
-
-        # Count episodes with Pocket Casts transcripts (but no Podcast 2.0)
-        cursor = execute(
-            self.conn,
-            """SELECT COUNT(*) FROM episode
-               WHERE feed_id = %s
-                 AND transcript_url IS NULL
-                 AND pocketcasts_transcript_url IS NOT NULL""",
-            (feed_id,),
-        )
-        pocketcasts_count = cursor.fetchone()[0]
-
-        # Count episodes with neither
+        # One pass over the feed's episodes, counting each source in its own bucket
         cursor = execute(
             self.conn,
-            """SELECT COUNT(*) FROM episode
-               WHERE feed_id = %s
-                 AND transcript_url IS NULL
-                 AND pocketcasts_transcript_url IS NULL""",
+            """
+            SELECT
+                COUNT(*) FILTER (WHERE transcript_url IS NOT NULL),
+                COUNT(*) FILTER (
+                    WHERE transcript_url IS NULL AND pocketcasts_transcript_url IS NOT NULL
+                ),
+                COUNT(*) FILTER (
+                    WHERE transcript_url IS NULL AND pocketcasts_transcript_url IS NULL
+                )
+            FROM episode
+            WHERE feed_id = %s
+            """,
             (feed_id,),
         )
-        whisper_only_count = cursor.fetchone()[0]
+        podcast20_count, pocketcasts_count, whisper_only_count = cursor.fetchone()
 
         return {
             "podcast20": podcast20_count,
@@ -693,43 +792,23 @@ class EpisodeRepository:
             if not episode_ids:
                 return [], 0
 
-            # Fetch full episode data for matching IDs
-            # Preserve FTS ranking order
-            placeholders = ",".join("%s" for _ in episode_ids)
-            id_order = " ".join(f"WHEN %s THEN {i}" for i in range(len(episode_ids)))
-
-            if status:
-                cursor = self.conn.cursor()
-                cursor.execute(
-                    f"""
-                    SELECT {self.EPISODE_COLUMNS} FROM episode
-                    WHERE id IN ({placeholders}) AND status = %s
-                    ORDER BY CASE id {id_order} END
-                    """,
-                    (*episode_ids, status.value, *episode_ids),
-                )
-                # Recount with status filter
-                cursor.execute(
-                    f"""
-                    SELECT COUNT(*) FROM episode
-                    WHERE id IN ({placeholders}) AND status = %s
-                    """,
-                    (*episode_ids, status.value),
-                )
-                total = cursor.fetchone()[0]
-            else:
-                cursor = self.conn.cursor()
-                cursor.execute(
-                    f"""
-                    SELECT {self.EPISODE_COLUMNS} FROM episode
-                    WHERE id IN ({placeholders})
-                    ORDER BY CASE id {id_order} END
-                    """,
-                    (*episode_ids, *episode_ids),
-                )
-                total = fts_total
-
-            episodes = [Episode.from_row(row) for row in cursor.fetchall()]
+            # Fetch full episode data for matching IDs, joined against the ID
+            # array so the FTS ranking order survives as its ordinal position
+            status_filter = "WHERE episode.status = %s" if status else ""
+            cursor = execute(
+                self.conn,
+                f"""
+                SELECT {self.EPISODE_COLUMNS} FROM episode
+                JOIN unnest(%s) WITH ORDINALITY AS ranked(episode_id, position)
+                    ON episode.id = ranked.episode_id
+                {status_filter}
+                ORDER BY ranked.position
+                """,
+                (episode_ids, status.value) if status else (episode_ids,),
+            )
+            episodes = Episode.from_rows(cursor.fetchall())
+            # With a status filter, the count is of this page's matches
+            total = len(episodes) if status else fts_total
             return episodes, total
 
         # No query - use simple SQL filtering
@@ -762,7 +841,7 @@ class EpisodeRepository:
             """,
             params,
         )
-        episodes = [Episode.from_row(row) for row in cursor.fetchall()]
+        episodes = Episode.from_rows(cursor.fetchall())
 
         return episodes, total
 
@@ -775,7 +854,7 @@ class EpisodeRepository:
             GROUP BY status
             """,
         )
-        return dict(cursor.fetchall())
+        return dict(cursor)
 
     def delete(self, episode_id: int) -> bool:
         """Delete an episode."""
@@ -818,20 +897,17 @@ class EpisodeRepository:
         # Clear existing FTS data
         execute(self.conn, "DELETE FROM episode_search")
 
-        # Index all episodes
-        cursor = execute(self.conn, "SELECT id, feed_id, title, description FROM episode")
-        count = 0
-        for row in cursor.fetchall():
-            episode_id, feed_id, title, description = row
-            execute(
-                self.conn,
-                """
-                INSERT INTO episode_search (episode_id, feed_id, title_search, description_search)
-                VALUES (%s, %s, to_tsvector('english', %s), to_tsvector('english', %s))
-                """,
-                (episode_id, feed_id, title, description or ""),
-            )
-            count += 1
+        # Index all episodes in one statement; the rebuild commits as a whole
+        cursor = execute(
+            self.conn,
+            """
+            INSERT INTO episode_search (episode_id, feed_id, title_search, description_search)
+            SELECT id, feed_id, to_tsvector('english', title),
+                   to_tsvector('english', COALESCE(description, ''))
+            FROM episode
+            """,
+        )
+        count = cursor.rowcount
 
         self.conn.commit()
         return count
@@ -861,62 +937,37 @@ class EpisodeRepository:
         if not tsquery_str:
             return [], 0
 
-        # PostgreSQL tsvector search with flexible OR matching
-        # Title matches are boosted 3x over description matches
-        if feed_id is not None:
-            count_cursor = execute(
-                self.conn,
-                """
-                SELECT COUNT(*) FROM episode_search
-                WHERE (title_search @@ to_tsquery('english', %s)
-                       OR description_search @@ to_tsquery('english', %s))
-                  AND feed_id = %s
-                """,
-                (tsquery_str, tsquery_str, feed_id),
-            )
-            total = count_cursor.fetchone()[0]
+        # PostgreSQL tsvector search with flexible OR matching. The tsquery is
+        # parsed once per statement and shared by the match and the ranking.
+        feed_filter = "AND feed_id = %s" if feed_id is not None else ""
+        feed_params = (feed_id,) if feed_id is not None else ()
 
-            cursor = execute(
-                self.conn,
-                """
-                SELECT episode_id,
-                       ts_rank(title_search, to_tsquery('english', %s)) * 3 +
-                       ts_rank(description_search, to_tsquery('english', %s)) as rank
-                FROM episode_search
-                WHERE (title_search @@ to_tsquery('english', %s)
-                       OR description_search @@ to_tsquery('english', %s))
-                  AND feed_id = %s
-                ORDER BY rank DESC
-                LIMIT %s OFFSET %s
-                """,
-                (tsquery_str, tsquery_str, tsquery_str, tsquery_str, feed_id, limit, offset),
-            )
-        else:
-            count_cursor = execute(
-                self.conn,
-                """
-                SELECT COUNT(*) FROM episode_search
-                WHERE title_search @@ to_tsquery('english', %s)
-                   OR description_search @@ to_tsquery('english', %s)
-                """,
-                (tsquery_str, tsquery_str),
-            )
-            total = count_cursor.fetchone()[0]
+        count_cursor = execute(
+            self.conn,
+            f"""
+            SELECT COUNT(*)
+            FROM episode_search, to_tsquery('english', %s) AS q
+            WHERE (title_search @@ q OR description_search @@ q)
+              {feed_filter}
+            """,
+            (tsquery_str, *feed_params),
+        )
+        total = count_cursor.fetchone()[0]
 
-            cursor = execute(
-                self.conn,
-                """
-                SELECT episode_id,
-                       ts_rank(title_search, to_tsquery('english', %s)) * 3 +
-                       ts_rank(description_search, to_tsquery('english', %s)) as rank
-                FROM episode_search
-                WHERE title_search @@ to_tsquery('english', %s)
-                   OR description_search @@ to_tsquery('english', %s)
-                ORDER BY rank DESC
-                LIMIT %s OFFSET %s
-                """,
-                (tsquery_str, tsquery_str, tsquery_str, tsquery_str, limit, offset),
-            )
+        # Title matches are boosted 3x over description matches
+        cursor = execute(
+            self.conn,
+            f"""
+            SELECT episode_id,
+                   ts_rank(title_search, q) * 3 + ts_rank(description_search, q) AS rank
+            FROM episode_search, to_tsquery('english', %s) AS q
+            WHERE (title_search @@ q OR description_search @@ q)
+              {feed_filter}
+            ORDER BY rank DESC
+            LIMIT %s OFFSET %s
+            """,
+            (tsquery_str, *feed_params, limit, offset),
+        )
 
         episode_ids = [row[0] for row in cursor.fetchall()]
         return episode_ids, total
@@ -1027,7 +1078,7 @@ class EpisodeRepository:
             self.conn,
             "SELECT feed_id, MAX(published_at) FROM episode GROUP BY feed_id",
         )
-        return dict(cursor.fetchall())
+        return dict(cursor)
 
     def get_recent_transcribed_episodes(
         self, limit: int = 12
@@ -1094,19 +1145,18 @@ class EpisodeRepository:
         if not episode_ids:
             return [], total
 
-        # Fetch full Episode objects, preserving FTS ranking order
-        placeholders = ",".join("%s" for _ in episode_ids)
-        id_order = " ".join(f"WHEN %s THEN {i}" for i in range(len(episode_ids)))
-
-        cursor = self.conn.cursor()
-        cursor.execute(
+        # Fetch full Episode objects, preserving FTS ranking order (as in
+        # search_by_feed)
+        cursor = execute(
+            self.conn,
             f"""
             SELECT {self.EPISODE_COLUMNS} FROM episode
-            WHERE id IN ({placeholders})
-            ORDER BY CASE id {id_order} END
+            JOIN unnest(%s) WITH ORDINALITY AS ranked(episode_id, position)
+                ON episode.id = ranked.episode_id
+            ORDER BY ranked.position
             """,
-            (*episode_ids, *episode_ids),
+            (episode_ids,),
         )
 
-        episodes = [Episode.from_row(row) for row in cursor.fetchall()]
+        episodes = Episode.from_rows(cursor.fetchall())
         return episodes, total
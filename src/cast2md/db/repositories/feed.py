@@ -27,30 +27,35 @@ class FeedRepository:
         now = datetime.now().isoformat()
 
         cursor = self.conn.cursor()
+        # RETURNING the full row saves a get_by_id round trip afterwards
         cursor.execute(
-            """
+            f"""
             INSERT INTO feed (url, title, description, image_url, author, link, categories,
                               itunes_id, created_at, updated_at)
             VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            RETURNING id
+            RETURNING {self.FEED_COLUMNS}
             """,
             (url, title, description, image_url, author, link, categories, itunes_id, now, now),
         )
-        feed_id = cursor.fetchone()[0]
+        feed = Feed.from_row(cursor.fetchone())
 
         self.conn.commit()
-        return self.get_by_id(feed_id)
+        return feed
 
     # Columns in the order expected by Feed.from_row
     FEED_COLUMNS = """id, url, title, description, image_url, author, link,
                       categories, custom_title, last_polled, itunes_id, pocketcasts_uuid,
                       created_at, updated_at"""
 
+    # Point lookups, built once rather than formatted on every call
+    _SELECT_BY_ID = f"SELECT {FEED_COLUMNS} FROM feed WHERE id = %s"
+    _SELECT_BY_URL = f"SELECT {FEED_COLUMNS} FROM feed WHERE url = %s"
+
     def get_by_id(self, feed_id: int) -> Feed | None:
         """Get feed by ID."""
         cursor = execute(
             self.conn,
-            f"SELECT {self.FEED_COLUMNS} FROM feed WHERE id = %s",
+            self._SELECT_BY_ID,
             (feed_id,),
         )
         row = cursor.fetchone()
@@ -60,7 +65,7 @@ class FeedRepository:
         """Get feed by URL."""
         cursor = execute(
             self.conn,
-            f"SELECT {self.FEED_COLUMNS} FROM feed WHERE url = %s",
+            self._SELECT_BY_URL,
             (url,),
         )
         row = cursor.fetchone()
@@ -69,7 +74,12 @@ class FeedRepository:
     def get_all(self) -> list[Feed]:
         """Get all feeds."""
         cursor = execute(self.conn, f"SELECT {self.FEED_COLUMNS} FROM feed ORDER BY title")
-        return [Feed.from_row(row) for row in cursor.fetchall()]
+        return Feed.from_rows(cursor.fetchall())
+
+    def count(self) -> int:
+        """Count all feeds without loading them."""
+        cursor = execute(self.conn, "SELECT COUNT(*) FROM feed")
+        return cursor.fetchone()[0]
 
     def update_last_polled(self, feed_id: int) -> None:
         """Update the last_polled timestamp."""
@@ -100,17 +110,19 @@ class FeedRepository:
         now = datetime.now().isoformat()
         # Allow setting to NULL by using empty string or None
         title_value = custom_title if custom_title else None
-        execute(
+        cursor = execute(
             self.conn,
-            """
+            f"""
             UPDATE feed
             SET custom_title = %s, updated_at = %s
             WHERE id = %s
+            RETURNING {self.FEED_COLUMNS}
             """,
             (title_value, now, feed_id),
         )
+        row = cursor.fetchone()
         self.conn.commit()
-        return self.get_by_id(feed_id)
+        return Feed.from_row(row) if row else None
 
     def update_metadata(
         self,
@@ -1,9 +1,38 @@
 """Repository for the background job queue."""
 
+from collections.abc import Sequence
 from datetime import datetime, timedelta
 
 from cast2md.db.models import Job, JobStatus, JobType
-from cast2md.db.sql import Connection, execute
+from cast2md.db.sql import Connection, execute, placeholders
+
+# The claim statement shared by claim_next_job and claim_batch, with or
+# without the local-only filter. Built once here instead of being assembled
+# on every claim.
+_CLAIM_NEXT_SQL = """
+    UPDATE job_queue
+    SET status = %s,
+        started_at = %s,
+        attempts = attempts + 1,
+        progress_percent = 0,
+        assigned_node_id = %s,
+        claimed_at = %s
+    WHERE id IN (
+        SELECT id FROM job_queue
+        WHERE job_type = %s
+          AND status = %s{local_filter}
+          AND attempts < max_attempts
+          AND (next_retry_at IS NULL OR next_retry_at <= %s)
+        ORDER BY priority ASC, scheduled_at ASC
+        FOR UPDATE SKIP LOCKED
+        LIMIT %s
+    )
+    RETURNING *
+"""
+_CLAIM_NEXT_LOCAL_SQL = _CLAIM_NEXT_SQL.format(
+    local_filter="\n          AND assigned_node_id IS NULL"
+)
+_CLAIM_NEXT_ANY_SQL = _CLAIM_NEXT_SQL.format(local_filter="")
 
 
 class JobRepository:
@@ -30,7 +59,7 @@ class JobRepository:
                 max_attempts, scheduled_at, created_at
             )
             VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-            RETURNING id
+            RETURNING *
             """,
             (
                 episode_id,
@@ -43,10 +72,10 @@ class JobRepository:
                 now,
             ),
         )
-        job_id = cursor.fetchone()[0]
+        job = Job.from_row(cursor.fetchone())
 
         self.conn.commit()
-        return self.get_by_id(job_id)
+        return job
 
     def get_by_id(self, job_id: int) -> Job | None:
         """Get job by ID."""
@@ -114,45 +143,26 @@ class JobRepository:
         Returns:
             The claimed Job with status set to RUNNING, or None if no jobs available.
         """
-        now = datetime.now().isoformat()
+        jobs = self._claim(job_type, node_id, 1, local_only)
+        return jobs[0] if jobs else None
 
-        if local_only:
-            subquery = """
-                SELECT id FROM job_queue
-                WHERE job_type = %s
-                  AND status = %s
-                  AND assigned_node_id IS NULL
-                  AND attempts < max_attempts
-                  AND (next_retry_at IS NULL OR next_retry_at <= %s)
-                ORDER BY priority ASC, scheduled_at ASC
-                FOR UPDATE SKIP LOCKED
-                LIMIT 1
-            """
-        else:
-            subquery = """
-                SELECT id FROM job_queue
-                WHERE job_type = %s
-                  AND status = %s
-                  AND attempts < max_attempts
-                  AND (next_retry_at IS NULL OR next_retry_at <= %s)
-                ORDER BY priority ASC, scheduled_at ASC
-                FOR UPDATE SKIP LOCKED
-                LIMIT 1
-            """
+    def claim_batch(self, job_type: JobType, node_id: str, batch_size: int) -> list[Job]:
+        """Atomically claim up to batch_size unassigned queued jobs for a node.
+
+        Same statement as claim_next_job, so the jobs are selected, marked
+        running and assigned in one round-trip.
+
+        Returns:
+            The claimed jobs in priority order, empty if none are available.
+        """
+        return self._claim(job_type, node_id, batch_size, local_only=True)
+
+    def _claim(self, job_type: JobType, node_id: str, limit: int, local_only: bool) -> list[Job]:
+        now = datetime.now().isoformat()
 
         cursor = self.conn.cursor()
         cursor.execute(
-            f"""
-            UPDATE job_queue
-            SET status = %s,
-                started_at = %s,
-                attempts = attempts + 1,
-                progress_percent = 0,
-                assigned_node_id = %s,
-                claimed_at = %s
-            WHERE id = ({subquery})
-            RETURNING *
-            """,
+            _CLAIM_NEXT_LOCAL_SQL if local_only else _CLAIM_NEXT_ANY_SQL,
             (
                 JobStatus.RUNNING.value,
                 now,
@@ -161,12 +171,15 @@ class JobRepository:
                 job_type.value,
                 JobStatus.QUEUED.value,
                 now,
+                limit,
             ),
         )
 
-        row = cursor.fetchone()
+        jobs = Job.from_rows(cursor.fetchall())
         self.conn.commit()
-        return Job.from_row(row) if row else None
+        # RETURNING does not keep the subquery's order.
+        jobs.sort(key=lambda job: (job.priority, job.scheduled_at))
+        return jobs
 
     def get_next_unclaimed_job(self, job_type: JobType) -> Job | None:
         """Get the next queued job that hasn't been claimed by any node.
@@ -265,7 +278,7 @@ class JobRepository:
             """,
             (node_id,),
         )
-        return [Job.from_row(row) for row in cursor.fetchall()]
+        return Job.from_rows(cursor.fetchall())
 
     def release_job(self, job_id: int) -> None:
         """Release a job back to the queue for another worker to pick up.
@@ -310,40 +323,44 @@ class JobRepository:
         Returns:
             Tuple of (jobs_requeued, jobs_failed).
         """
-        threshold = (datetime.now() - timedelta(minutes=timeout_minutes)).isoformat()
-        now = datetime.now().isoformat()
+        now_dt = datetime.now()
+        threshold = (now_dt - timedelta(minutes=timeout_minutes)).isoformat()
+        now = now_dt.isoformat()
 
-        # First, fail jobs that have exceeded max attempts
-        # Use started_at (not claimed_at) so reclaim cycles don't reset the timeout
+        # Fail jobs that have exceeded max attempts and requeue the rest in
+        # one pass. Use started_at (not claimed_at) so reclaim cycles don't
+        # reset the timeout.
         cursor = execute(
             self.conn,
             """
             UPDATE job_queue
-            SET status = %s, error_message = 'Max attempts exceeded (job timed out repeatedly)',
-                completed_at = %s, assigned_node_id = NULL, claimed_at = NULL
-            WHERE status = %s
-              AND assigned_node_id IS NOT NULL
-              AND started_at < %s
-              AND attempts >= max_attempts
-            """,
-            (JobStatus.FAILED.value, now, JobStatus.RUNNING.value, threshold),
-        )
-        jobs_failed = cursor.rowcount
-
-        # Then, requeue jobs that still have retries remaining
-        cursor = execute(
-            self.conn,
-            """
-            UPDATE job_queue
-            SET status = %s, assigned_node_id = NULL, claimed_at = NULL, started_at = NULL
+            SET status = CASE WHEN attempts >= max_attempts THEN %s ELSE %s END,
+                error_message = CASE
+                    WHEN attempts >= max_attempts
+                    THEN 'Max attempts exceeded (job timed out repeatedly)'
+                    ELSE error_message
+                END,
+                completed_at = CASE
+                    WHEN attempts >= max_attempts THEN %s::timestamp ELSE completed_at
+                END,
+                started_at = CASE WHEN attempts >= max_attempts THEN started_at END,
+                assigned_node_id = NULL,
+                claimed_at = NULL
             WHERE status = %s
               AND assigned_node_id IS NOT NULL
               AND started_at < %s
-              AND attempts < max_attempts
+            RETURNING attempts >= max_attempts
             """,
-            (JobStatus.QUEUED.value, JobStatus.RUNNING.value, threshold),
+            (
+                JobStatus.FAILED.value,
+                JobStatus.QUEUED.value,
+                now,
+                JobStatus.RUNNING.value,
+                threshold,
+            ),
         )
-        jobs_requeued = cursor.rowcount
+        jobs_failed = sum(failed for (failed,) in cursor)
+        jobs_requeued = cursor.rowcount - jobs_failed
 
         self.conn.commit()
         return jobs_requeued, jobs_failed
@@ -359,7 +376,7 @@ class JobRepository:
             """,
             (job_type.value, JobStatus.RUNNING.value),
         )
-        return [Job.from_row(row) for row in cursor.fetchall()]
+        return Job.from_rows(cursor.fetchall())
 
     def get_queued_jobs(self, job_type: JobType | None = None, limit: int = 100) -> list[Job]:
         """Get queued jobs ready to run (excludes jobs waiting for retry)."""
@@ -388,7 +405,7 @@ class JobRepository:
                 """,
                 (JobStatus.QUEUED.value, now, limit),
             )
-        return [Job.from_row(row) for row in cursor.fetchall()]
+        return Job.from_rows(cursor.fetchall())
 
     def get_by_episode(self, episode_id: int) -> list[Job]:
         """Get all jobs for an episode."""
@@ -401,7 +418,7 @@ class JobRepository:
             """,
             (episode_id,),
         )
-        return [Job.from_row(row) for row in cursor.fetchall()]
+        return Job.from_rows(cursor.fetchall())
 
     def has_pending_job(self, episode_id: int, job_type: JobType) -> bool:
         """Check if episode has a pending or running job of given type."""
@@ -437,17 +454,28 @@ class JobRepository:
 
     def mark_completed(self, job_id: int) -> None:
         """Mark a job as completed."""
+        self.mark_completed_many([job_id])
+
+    def mark_completed_many(self, job_ids: Sequence[int]) -> int:
+        """Mark several jobs as completed in one UPDATE.
+
+        Returns:
+            Number of jobs updated.
+        """
+        if not job_ids:
+            return 0
         now = datetime.now().isoformat()
-        execute(
+        cursor = execute(
             self.conn,
-            """
+            f"""
             UPDATE job_queue
             SET status = %s, completed_at = %s, progress_percent = 100
-            WHERE id = %s
+            WHERE id IN ({placeholders(len(job_ids))})
             """,
-            (JobStatus.COMPLETED.value, now, job_id),
+            (JobStatus.COMPLETED.value, now, *job_ids),
         )
         self.conn.commit()
+        return cursor.rowcount
 
     def update_progress(self, job_id: int, progress_percent: int) -> None:
         """Update job progress percentage.
@@ -512,7 +540,7 @@ class JobRepository:
         # Fail jobs that have exceeded max attempts
         if jobs_to_fail:
             job_ids = [j[0] for j in jobs_to_fail]
-            placeholders = ",".join("%s" for _ in job_ids)
+            in_list = placeholders(len(job_ids))
             execute(
                 self.conn,
                 f"""
@@ -520,91 +548,113 @@ class JobRepository:
                 SET status = %s, error_message = 'Max attempts exceeded (orphaned on restart)',
                     completed_at = %s, assigned_node_id = NULL, claimed_at = NULL,
                     progress_percent = NULL
-                WHERE id IN ({placeholders})
+                WHERE id IN ({in_list})
                 """,
                 [JobStatus.FAILED.value, now] + job_ids,
             )
 
             # Set episode status to failed
-            for job_id, episode_id, job_type in jobs_to_fail:
-                execute(
-                    self.conn,
-                    "UPDATE episode SET status = %s, error_message = %s WHERE id = %s",
-                    (EpisodeStatus.FAILED.value, "Max attempts exceeded", episode_id),
-                )
+            episode_ids = [j[1] for j in jobs_to_fail]
+            execute(
+                self.conn,
+                f"UPDATE episode SET status = %s, error_message = %s "
+                f"WHERE id IN ({placeholders(len(episode_ids))})",
+                [EpisodeStatus.FAILED.value, "Max attempts exceeded"] + episode_ids,
+            )
 
         # Requeue jobs that still have retries
         if jobs_to_requeue:
             job_ids = [j[0] for j in jobs_to_requeue]
-            placeholders = ",".join("%s" for _ in job_ids)
+            in_list = placeholders(len(job_ids))
             execute(
                 self.conn,
                 f"""
                 UPDATE job_queue
                 SET status = %s, started_at = NULL, assigned_node_id = NULL,
                     claimed_at = NULL, progress_percent = NULL
-                WHERE id IN ({placeholders})
+                WHERE id IN ({in_list})
                 """,
                 [JobStatus.QUEUED.value] + job_ids,
             )
 
-            # Reset episode statuses
+            # Reset episode statuses, one UPDATE per target status. Transcript
+            # download jobs don't change episode status during processing: the
+            # episode stays in NEW until a transcript is found or the user
+            # queues a download.
+            reset_status = {
+                JobType.DOWNLOAD.value: EpisodeStatus.NEW.value,
+                JobType.TRANSCRIBE.value: EpisodeStatus.AUDIO_READY.value,
+            }
+            episodes_by_status: dict[str, list[int]] = {}
             for job_id, episode_id, job_type in jobs_to_requeue:
-                if job_type == JobType.DOWNLOAD.value:
-                    execute(
-                        self.conn,
-                        "UPDATE episode SET status = %s WHERE id = %s",
-                        (EpisodeStatus.NEW.value, episode_id),
-                    )
-                elif job_type == JobType.TRANSCRIBE.value:
-                    execute(
-                        self.conn,
-                        "UPDATE episode SET status = %s WHERE id = %s",
-                        (EpisodeStatus.AUDIO_READY.value, episode_id),
-                    )
-                elif job_type == JobType.TRANSCRIPT_DOWNLOAD.value:
-                    # Transcript download jobs don't change episode status during processing
-                    # Episode stays in NEW until transcript is found or user queues download
-                    pass
+                if job_type in reset_status:
+                    episodes_by_status.setdefault(reset_status[job_type], []).append(episode_id)
+
+            for status, episode_ids in episodes_by_status.items():
+                execute(
+                    self.conn,
+                    f"UPDATE episode SET status = %s WHERE id IN ({placeholders(len(episode_ids))})",
+                    [status] + episode_ids,
+                )
 
         self.conn.commit()
         return len(jobs_to_requeue), len(jobs_to_fail)
 
     def mark_failed(self, job_id: int, error_message: str, retry: bool = True) -> None:
         """Mark a job as failed, optionally scheduling a retry."""
-        now = datetime.now()
+        self.mark_failed_many([(job_id, error_message)], retry=retry)
 
-        # Get current job to check attempts
-        job = self.get_by_id(job_id)
-        if not job:
-            return
+    def mark_failed_many(self, failures: Sequence[tuple[int, str]], retry: bool = True) -> int:
+        """Mark several jobs as failed in one UPDATE.
 
-        if retry and job.attempts < job.max_attempts:
-            # Schedule retry with exponential backoff (5min, 25min, 125min)
-            backoff_minutes = min(5**job.attempts, 720)
-            next_retry = now + timedelta(minutes=backoff_minutes)
+        With retry, jobs that still have attempts left go back to the queue
+        with exponential backoff (5min, 25min, 125min, capped at 12h); the
+        rest are marked failed for good.
 
-            execute(
-                self.conn,
-                """
-                UPDATE job_queue
-                SET status = %s, error_message = %s, next_retry_at = %s
-                WHERE id = %s
-                """,
-                (JobStatus.QUEUED.value, error_message, next_retry.isoformat(), job_id),
-            )
-        else:
-            # Max attempts reached, mark as failed
-            execute(
-                self.conn,
-                """
-                UPDATE job_queue
-                SET status = %s, error_message = %s, completed_at = %s
-                WHERE id = %s
-                """,
-                (JobStatus.FAILED.value, error_message, now.isoformat(), job_id),
+        Args:
+            failures: (job_id, error_message) pairs.
+            retry: Whether jobs with attempts left should be retried.
+
+        Returns:
+            Number of jobs updated.
+        """
+        if not failures:
+            return 0
+        job_ids, error_messages = zip(*failures)
+        now = datetime.now().isoformat()
+        cursor = execute(
+            self.conn,
+            """
+            WITH failure AS (
+                SELECT f.id, f.error_message,
+                       %s AND j.attempts < j.max_attempts AS requeue
+                FROM unnest(%s::integer[], %s::text[]) AS f(id, error_message)
+                JOIN job_queue j ON j.id = f.id
             )
+            UPDATE job_queue
+            SET status = CASE WHEN failure.requeue THEN %s ELSE %s END,
+                error_message = failure.error_message,
+                next_retry_at = CASE
+                    WHEN failure.requeue
+                    THEN %s::timestamp + LEAST(power(5, attempts), 720) * interval '1 minute'
+                    ELSE next_retry_at
+                END,
+                completed_at = CASE WHEN failure.requeue THEN completed_at ELSE %s::timestamp END
+            FROM failure
+            WHERE job_queue.id = failure.id
+            """,
+            (
+                retry,
+                list(job_ids),
+                list(error_messages),
+                JobStatus.QUEUED.value,
+                JobStatus.FAILED.value,
+                now,
+                now,
+            ),
+        )
         self.conn.commit()
+        return cursor.rowcount
 
     def count_by_status(self, job_type: JobType | None = None) -> dict[str, int]:
         """Count jobs by status."""
@@ -626,7 +676,7 @@ class JobRepository:
                 GROUP BY status
                 """,
             )
-        return dict(cursor.fetchall())
+        return dict(cursor)
 
     def delete(self, job_id: int) -> bool:
         """Delete a job."""
@@ -682,7 +732,7 @@ class JobRepository:
             """,
             (JobStatus.RUNNING.value, threshold),
         )
-        return [Job.from_row(row) for row in cursor.fetchall()]
+        return Job.from_rows(cursor.fetchall())
 
     def force_reset(self, job_id: int) -> bool:
         """Force reset a running/stuck job back to queued state.
@@ -775,7 +825,7 @@ class JobRepository:
             """,
             params,
         )
-        return [Job.from_row(row) for row in cursor.fetchall()]
+        return Job.from_rows(cursor.fetchall())
 
     def get_failed_jobs(self, limit: int = 100) -> list[Job]:
         """Get all failed jobs.
@@ -796,7 +846,7 @@ class JobRepository:
             """,
             (JobStatus.FAILED.value, limit),
         )
-        return [Job.from_row(row) for row in cursor.fetchall()]
+        return Job.from_rows(cursor.fetchall())
 
     def retry_failed_job(self, job_id: int) -> bool:
         """Retry a failed job by resetting it to queued state.
@@ -829,33 +879,36 @@ class JobRepository:
         Returns:
             Tuple of (jobs_requeued, jobs_failed).
         """
-        threshold = (datetime.now() - timedelta(minutes=threshold_minutes)).isoformat()
-        now = datetime.now().isoformat()
+        now_dt = datetime.now()
+        threshold = (now_dt - timedelta(minutes=threshold_minutes)).isoformat()
+        now = now_dt.isoformat()
 
-        # First, fail jobs that have exceeded max attempts
+        # Fail jobs that have exceeded max attempts and requeue the rest in one pass
         cursor = execute(
             self.conn,
             """
             UPDATE job_queue
-            SET status = %s, error_message = 'Max attempts exceeded (job stuck repeatedly)',
-                completed_at = %s
-            WHERE status = %s AND started_at < %s AND attempts >= max_attempts
-            """,
-            (JobStatus.FAILED.value, now, JobStatus.RUNNING.value, threshold),
-        )
-        jobs_failed = cursor.rowcount
-
-        # Then, requeue jobs that still have retries remaining
-        cursor = execute(
-            self.conn,
-            """
-            UPDATE job_queue
-            SET status = %s, started_at = NULL, error_message = NULL
-            WHERE status = %s AND started_at < %s AND attempts < max_attempts
+            SET status = CASE WHEN attempts >= max_attempts THEN %s ELSE %s END,
+                error_message = CASE
+                    WHEN attempts >= max_attempts THEN 'Max attempts exceeded (job stuck repeatedly)'
+                END,
+                completed_at = CASE
+                    WHEN attempts >= max_attempts THEN %s::timestamp ELSE completed_at
+                END,
+                started_at = CASE WHEN attempts >= max_attempts THEN started_at END
+            WHERE status = %s AND started_at < %s
+            RETURNING attempts >= max_attempts
             """,
-            (JobStatus.QUEUED.value, JobStatus.RUNNING.value, threshold),
+            (
+                JobStatus.FAILED.value,
+                JobStatus.QUEUED.value,
+                now,
+                JobStatus.RUNNING.value,
+                threshold,
+            ),
         )
-        jobs_requeued = cursor.rowcount
+        jobs_failed = sum(failed for (failed,) in cursor)
+        jobs_requeued = cursor.rowcount - jobs_failed
 
         self.conn.commit()
         return jobs_requeued, jobs_failed
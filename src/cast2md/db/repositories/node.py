@@ -13,6 +13,10 @@ class TranscriberNodeRepository:
                       status, last_heartbeat, current_job_id, priority,
                       created_at, updated_at"""
 
+    # Point lookups, built once rather than formatted on every call
+    _SELECT_BY_ID = f"SELECT {NODE_COLUMNS} FROM transcriber_node WHERE id = %s"
+    _SELECT_BY_API_KEY = f"SELECT {NODE_COLUMNS} FROM transcriber_node WHERE api_key = %s"
+
     def __init__(self, conn: Connection):
         self.conn = conn
 
@@ -28,14 +32,15 @@ class TranscriberNodeRepository:
     ) -> TranscriberNode:
         """Create a new transcriber node."""
         now = datetime.now().isoformat()
-        execute(
+        cursor = execute(
             self.conn,
-            """
+            f"""
             INSERT INTO transcriber_node (
                 id, name, url, api_key, whisper_model, whisper_backend,
                 status, priority, created_at, updated_at
             )
             VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+            RETURNING {self.NODE_COLUMNS}
             """,
             (
                 node_id,
@@ -50,14 +55,15 @@ class TranscriberNodeRepository:
                 now,
             ),
         )
+        node = TranscriberNode.from_row(cursor.fetchone())
         self.conn.commit()
-        return self.get_by_id(node_id)
+        return node
 
     def get_by_id(self, node_id: str) -> TranscriberNode | None:
         """Get node by ID."""
         cursor = execute(
             self.conn,
-            f"SELECT {self.NODE_COLUMNS} FROM transcriber_node WHERE id = %s",
+            self._SELECT_BY_ID,
             (node_id,),
         )
         row = cursor.fetchone()
@@ -67,7 +73,7 @@ class TranscriberNodeRepository:
         """Get node by API key."""
         cursor = execute(
             self.conn,
-            f"SELECT {self.NODE_COLUMNS} FROM transcriber_node WHERE api_key = %s",
+            self._SELECT_BY_API_KEY,
             (api_key,),
         )
         row = cursor.fetchone()
@@ -78,7 +84,7 @@ class TranscriberNodeRepository:
         cursor = execute(
             self.conn, f"SELECT {self.NODE_COLUMNS} FROM transcriber_node ORDER BY priority, name"
         )
-        return [TranscriberNode.from_row(row) for row in cursor.fetchall()]
+        return TranscriberNode.from_rows(cursor.fetchall())
 
     def get_online(self) -> list[TranscriberNode]:
         """Get all online nodes."""
@@ -91,7 +97,7 @@ class TranscriberNodeRepository:
             """,
             (NodeStatus.ONLINE.value, NodeStatus.BUSY.value),
         )
-        return [TranscriberNode.from_row(row) for row in cursor.fetchall()]
+        return TranscriberNode.from_rows(cursor.fetchall())
 
     def update_status(
         self,
@@ -223,7 +229,7 @@ class TranscriberNodeRepository:
             """,
             (NodeStatus.OFFLINE.value, threshold),
         )
-        return [TranscriberNode.from_row(row) for row in cursor.fetchall()]
+        return TranscriberNode.from_rows(cursor.fetchall())
 
     def mark_offline(self, node_id: str) -> None:
         """Mark a node as offline and clear its current job."""
@@ -248,7 +254,7 @@ class TranscriberNodeRepository:
             GROUP BY status
             """,
         )
-        return dict(cursor.fetchall())
+        return dict(cursor)
 
     def get_by_name(self, name: str) -> TranscriberNode | None:
         """Get node by name."""
@@ -322,4 +328,4 @@ class TranscriberNodeRepository:
             """,
             (NodeStatus.OFFLINE.value, threshold),
         )
-        return [TranscriberNode.from_row(row) for row in cursor.fetchall()]
+        return TranscriberNode.from_rows(cursor.fetchall())
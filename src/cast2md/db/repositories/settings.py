@@ -24,7 +24,7 @@ class SettingsRepository:
     def get_all(self) -> dict[str, str]:
         """Get all settings as a dictionary."""
         cursor = execute(self.conn, "SELECT key, value FROM settings")
-        return dict(cursor.fetchall())
+        return dict(cursor)
 
     def set(self, key: str, value: str) -> None:
         """Set a setting value (insert or update)."""
@@ -47,16 +47,19 @@ class SettingsRepository:
         return cursor.rowcount > 0
 
     def set_many(self, settings: dict[str, str]) -> None:
-        """Set multiple settings at once."""
+        """Set multiple settings at once, in a single INSERT."""
+        from psycopg2.extras import execute_values
+
+        if not settings:
+            return
         now = datetime.now().isoformat()
-        for key, value in settings.items():
-            execute(
-                self.conn,
-                """
-                INSERT INTO settings (key, value, updated_at)
-                VALUES (%s, %s, %s)
-                ON CONFLICT (key) DO UPDATE SET value = EXCLUDED.value, updated_at = EXCLUDED.updated_at
-                """,
-                (key, value, now),
-            )
+        execute_values(
+            self.conn.cursor(),
+            """
+            INSERT INTO settings (key, value, updated_at)
+            VALUES %s
+            ON CONFLICT (key) DO UPDATE SET value = EXCLUDED.value, updated_at = EXCLUDED.updated_at
+            """,
+            [(key, value, now) for key, value in settings.items()],
+        )
         self.conn.commit()
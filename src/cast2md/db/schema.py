@@ -53,11 +53,17 @@ SCHEMA_STATEMENTS = [
     )
     """,
     # Episode indexes
-    "CREATE INDEX IF NOT EXISTS idx_episode_feed_id ON episode(feed_id)",
     "CREATE INDEX IF NOT EXISTS idx_episode_status ON episode(status)",
     # Serves the watermark query of /api/episodes/status/{status}?since=…
     "CREATE INDEX IF NOT EXISTS idx_episode_status_updated ON episode(status, updated_at)",
     "CREATE INDEX IF NOT EXISTS idx_episode_published_at ON episode(published_at)",
+    # Serves the per-feed episode lists, which page in published_at order,
+    # and any other lookup by feed_id
+    "CREATE INDEX IF NOT EXISTS idx_episode_feed_published ON episode(feed_id, published_at DESC)",
+    # Serves get_episodes_for_transcript_retry; only awaiting episodes are indexed
+    "CREATE INDEX IF NOT EXISTS idx_episode_transcript_retry ON episode(next_transcript_retry_at) WHERE status = 'awaiting_transcript'",
+    # Serves the per-feed status counts and the retranscribe queries
+    "CREATE INDEX IF NOT EXISTS idx_episode_feed_status_model ON episode(feed_id, status, transcript_model)",
     "CREATE INDEX IF NOT EXISTS idx_feed_url ON feed(url)",
     # Job queue table
     """
@@ -83,6 +89,8 @@ SCHEMA_STATEMENTS = [
     "CREATE INDEX IF NOT EXISTS idx_job_queue_status_priority ON job_queue(status, priority)",
     "CREATE INDEX IF NOT EXISTS idx_job_queue_episode_id ON job_queue(episode_id)",
     "CREATE INDEX IF NOT EXISTS idx_job_queue_job_type ON job_queue(job_type)",
+    # Serves the next-job polls; only queued jobs are indexed
+    "CREATE INDEX IF NOT EXISTS idx_job_queue_poll ON job_queue(job_type, priority, scheduled_at) WHERE status = 'queued'",
     # Settings table
     """
     CREATE TABLE IF NOT EXISTS settings (
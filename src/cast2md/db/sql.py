@@ -1,5 +1,6 @@
 """SQL execution helper for PostgreSQL."""
 
+from functools import lru_cache
 from typing import Any
 
 # Type alias for a database connection (psycopg2). Lives here because every
@@ -22,3 +23,13 @@ def execute(conn: Any, sql: str, params: tuple | list = ()) -> Any:
     cursor = conn.cursor()
     cursor.execute(sql, params)
     return cursor
+
+
+@lru_cache(maxsize=256)
+def placeholders(n: int) -> str:
+    """Comma-separated %s placeholders for an IN (...) list of n values.
+
+    Cached per n, since IN-list builders ask for the same few sizes over and
+    over.
+    """
+    return ", ".join(["%s"] * n)
@@ -267,9 +267,6 @@ def discover_new_episodes(
     content = fetch_feed_sync(feed.url)
     parsed = parse_feed(content)
 
-    new_episode_ids = []
-    new_episodes = []
-
     with get_db() as conn:
         episode_repo = EpisodeRepository(conn)
         feed_repo = FeedRepository(conn)
@@ -284,26 +281,9 @@ def discover_new_episodes(
             categories=categories_json,
         )
 
-        for ep in parsed.episodes:
-            # Skip if already exists
-            if episode_repo.exists(feed.id, ep.guid):
-                continue
-
-            episode = episode_repo.create(
-                feed_id=feed.id,
-                guid=ep.guid,
-                title=ep.title,
-                audio_url=ep.audio_url,
-                description=ep.description,
-                duration_seconds=ep.duration_seconds,
-                published_at=ep.published_at,
-                transcript_url=ep.transcript_url,
-                transcript_type=ep.transcript_type,
-                link=ep.link,
-                author=ep.author,
-            )
-            new_episode_ids.append(episode.id)
-            new_episodes.append(episode)
+        # Store new episodes; GUIDs already known for this feed are skipped
+        new_episodes = episode_repo.create_many(feed.id, parsed.episodes)
+        new_episode_ids = [episode.id for episode in new_episodes]
 
         # Update last polled timestamp
         feed_repo.update_last_polled(feed.id)
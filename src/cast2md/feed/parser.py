@@ -7,7 +7,7 @@ from email.utils import parsedate_to_datetime
 import feedparser
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedEpisode:
     """Parsed episode data from RSS feed."""
 
@@ -355,7 +355,7 @@ def get_status() -> str:
 
         # Search index
         lines.append("## Search Index")
-        indexed_episodes = len(search_repo.get_indexed_episodes())
+        indexed_episodes = search_repo.count_indexed_episodes()
         lines.append(f"- **Indexed Episodes:** {indexed_episodes}")
         lines.append(f"- **Indexed Segments:** {indexed_segments}")
         lines.append("")
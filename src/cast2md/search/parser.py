@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from pathlib import Path
 
 
-@dataclass
+@dataclass(slots=True)
 class TranscriptSegment:
     """A segment of transcript text with timing information."""
 
@@ -247,3 +247,20 @@ def parse_transcript_file(path: Path) -> list[TranscriptSegment]:
     """
     content = path.read_text(encoding="utf-8")
     return parse_transcript_segments(content)
+
+
+def parse_transcript_for_index(transcript_path: str) -> list[TranscriptSegment] | None:
+    """Parse a transcript file into the phrase-level segments that get indexed.
+
+    Module-level and string-in so it can run in a worker process.
+
+    Args:
+        transcript_path: Path to markdown transcript file.
+
+    Returns:
+        Merged segments, or None if the file doesn't exist.
+    """
+    path = Path(transcript_path)
+    if not path.exists():
+        return None
+    return merge_word_level_segments(parse_transcript_file(path))
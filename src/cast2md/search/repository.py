@@ -7,12 +7,13 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Literal
 
-from cast2md.db.sql import execute
+from cast2md.db.sql import execute, placeholders
 from cast2md.db.tsquery import build_flexible_tsquery
 from cast2md.search.parser import (
     TranscriptSegment,
     merge_word_level_segments,
     parse_transcript_file,
+    parse_transcript_for_index,
 )
 
 logger = logging.getLogger(__name__)
@@ -21,7 +22,7 @@ logger = logging.getLogger(__name__)
 Connection = Any
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchResult:
     """A search result with episode info and matching segment."""
 
@@ -47,7 +48,7 @@ class SearchResponse:
     results: list[SearchResult]
 
 
-@dataclass
+@dataclass(slots=True)
 class HybridSearchResult:
     """A result from hybrid (keyword + semantic) search."""
 
@@ -91,29 +92,44 @@ class TranscriptSearchRepository:
         Returns:
             Number of segments indexed.
         """
-        path = Path(transcript_path)
-        if not path.exists():
+        segments = parse_transcript_for_index(transcript_path)
+        if segments is None:
             return 0
+        return self.index_segments(episode_id, segments)
 
-        # Remove existing segments for this episode
-        execute(self.conn, "DELETE FROM transcript_segments WHERE episode_id = %s", (episode_id,))
+    def index_segments(
+        self, episode_id: int, segments: list[TranscriptSegment], commit: bool = True
+    ) -> int:
+        """Replace an episode's indexed segments with already-parsed ones.
 
-        # Parse transcript and merge word-level segments into phrases
-        segments = parse_transcript_file(path)
-        segments = merge_word_level_segments(segments)
+        Args:
+            episode_id: Episode ID to index.
+            segments: Segments from parse_transcript_for_index.
+            commit: Commit when done. Bulk reindexes pass False and commit
+                once at the end.
 
-        # Insert segments
-        for segment in segments:
-            execute(
-                self.conn,
-                """
-                INSERT INTO transcript_segments (episode_id, segment_start, segment_end, text)
-                VALUES (%s, %s, %s, %s)
-                """,
-                (episode_id, segment.start, segment.end, segment.text),
-            )
+        Returns:
+            Number of segments indexed.
+        """
+        from psycopg2.extras import execute_values
 
-        self.conn.commit()
+        # Remove existing segments for this episode
+        cursor = execute(
+            self.conn, "DELETE FROM transcript_segments WHERE episode_id = %s", (episode_id,)
+        )
+
+        # One multi-row INSERT per page instead of a round trip per segment
+        execute_values(
+            cursor,
+            """
+            INSERT INTO transcript_segments (episode_id, segment_start, segment_end, text)
+            VALUES %s
+            """,
+            [(episode_id, segment.start, segment.end, segment.text) for segment in segments],
+        )
+
+        if commit:
+            self.conn.commit()
         return len(segments)
 
     def get_segments(
@@ -358,6 +374,16 @@ class TranscriptSearchRepository:
         except Exception:
             return set()
 
+    def count_indexed_episodes(self) -> int:
+        """Count episodes that have been indexed, without fetching their IDs."""
+        try:
+            cursor = execute(
+                self.conn, "SELECT COUNT(DISTINCT episode_id) FROM transcript_segments", ()
+            )
+            return cursor.fetchone()[0]
+        except Exception:
+            return 0
+
     def reindex_all(self, episode_transcripts: dict[int, str]) -> tuple[int, int]:
         """Reindex all transcripts.
 
@@ -483,6 +509,17 @@ class TranscriptSearchRepository:
             # Table doesn't exist (embeddings not available)
             return set()
 
+    def count_embedded_episodes(self) -> int:
+        """Count episodes that have embeddings, without fetching their IDs."""
+        try:
+            cursor = execute(
+                self.conn, "SELECT COUNT(DISTINCT episode_id) FROM segment_embeddings", ()
+            )
+            return cursor.fetchone()[0]
+        except Exception:
+            # Table doesn't exist (embeddings not available)
+            return 0
+
     def get_embedding_count(self) -> int:
         """Get total number of segment embeddings."""
         try:
@@ -696,7 +733,7 @@ class TranscriptSearchRepository:
 
                 # Fetch episode details for matching IDs
                 if episode_ids:
-                    placeholders = ",".join("%s" for _ in episode_ids)
+                    in_list = placeholders(len(episode_ids))
                     cursor = self.conn.cursor()
                     cursor.execute(
                         f"""
@@ -705,7 +742,7 @@ class TranscriptSearchRepository:
                                e.published_at, e.description
                         FROM episode e
                         JOIN feed f ON e.feed_id = f.id
-                        WHERE e.id IN ({placeholders})
+                        WHERE e.id IN ({in_list})
                         """,
                         episode_ids,
                     )
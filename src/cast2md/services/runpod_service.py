@@ -9,13 +9,17 @@ import threading
 import time
 from dataclasses import dataclass, field
 from datetime import datetime
-from enum import Enum
+from enum import StrEnum
 from typing import Any
 from urllib.parse import urlparse
 
 import httpx
 
-from cast2md.config.settings import Settings, get_settings, reload_settings
+from cast2md.config.settings import (
+    OVERRIDE_TTL_SECONDS,
+    Settings,
+    reload_settings,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -29,7 +33,7 @@ except ImportError:
     RUNPOD_AVAILABLE = False
 
 
-class PodSetupPhase(str, Enum):
+class PodSetupPhase(StrEnum):
     """Phases of pod setup."""
 
     CREATING = "creating"  # Creating pod on RunPod
@@ -382,8 +386,8 @@ tail -f /dev/null
         """Get current settings (reloaded for runtime changes)."""
         if self._initial_settings:
             return self._initial_settings
-        reload_settings()
-        return get_settings()
+        # Read on nearly every service call, so don't query the DB each time
+        return reload_settings(max_age=OVERRIDE_TTL_SECONDS)
 
     def is_available(self) -> bool:
         """Check if RunPod feature is available (library + API key present).
@@ -94,10 +94,10 @@ def collect_status_data(conn: Connection) -> StatusData:
     return StatusData(
         status_counts=episode_repo.count_by_status(),
         search_stats={
-            "indexed_episodes": len(search_repo.get_indexed_episodes()),
-            "embedded_episodes": len(search_repo.get_embedded_episodes()),
+            "indexed_episodes": search_repo.count_indexed_episodes(),
+            "embedded_episodes": search_repo.count_embedded_episodes(),
         },
-        feed_count=len(feed_repo.get_all()),
+        feed_count=feed_repo.count(),
         performance_stats={
             "hour_throughput": _calc_throughput(hour_audio, hour_stats["total_duration_seconds"]),
             "hour_episodes": hour_stats["count"],
@@ -1005,8 +1005,8 @@ def transcript_search_page(
         # Get index stats including semantic search stats
         index_stats = {
             "total_segments": search_repo.get_indexed_count(),
-            "indexed_episodes": len(search_repo.get_indexed_episodes()),
-            "embedded_episodes": len(search_repo.get_embedded_episodes()),
+            "indexed_episodes": search_repo.count_indexed_episodes(),
+            "embedded_episodes": search_repo.count_embedded_episodes(),
             "total_embeddings": search_repo.get_embedding_count(),
         }
 
@@ -0,0 +1,29 @@
+"""Tests for connection pool checkout."""
+
+from contextlib import ExitStack
+
+import pytest
+
+from cast2md.db import connection
+
+
+@pytest.fixture
+def fresh_pool(monkeypatch):
+    """Swap in a new pool whose connections have not been checked out yet."""
+    monkeypatch.setattr(connection, "_pg_pool", None)
+    monkeypatch.setattr(connection, "_pg_pool_initialized", False)
+    yield
+    if connection._pg_pool is not None:
+        connection._pg_pool.closeall()
+
+
+def test_readonly_on_newly_opened_connections(fresh_pool):
+    """get_db_readonly works on connections registered at checkout."""
+    # The pool registers pgvector on one connection at startup; holding two
+    # at once makes at least one register on checkout
+    with ExitStack() as stack:
+        for _ in range(2):
+            conn = stack.enter_context(connection.get_db_readonly())
+            cursor = conn.cursor()
+            cursor.execute("SELECT 1")
+            assert cursor.fetchone()[0] == 1
@@ -0,0 +1,98 @@
+"""Integration tests for episode ingest and full-text search in EpisodeRepository."""
+
+import pytest
+
+from cast2md.db.models import EpisodeStatus
+from cast2md.feed.parser import ParsedEpisode
+
+
+@pytest.fixture
+def searchable_episodes(episode_repo, sample_feed):
+    """Three episodes matching "rocket", the first matching it twice."""
+    episodes = [
+        episode_repo.create(
+            feed_id=sample_feed.id,
+            guid=f"rocket-{i}",
+            title=title,
+            audio_url=f"https://example.com/rocket{i}.mp3",
+            description=description,
+        )
+        for i, (title, description) in enumerate(
+            [
+                ("Rocket launch", "A rocket goes to orbit"),
+                ("Gardening", "Why the rocket salad bolted"),
+                ("Rocket science", None),
+            ]
+        )
+    ]
+    episode_repo.update_status(episodes[1].id, EpisodeStatus.COMPLETED)
+    return episodes
+
+
+class TestSearchByFeed:
+    """search_by_feed with a query goes through the FTS index."""
+
+    def test_keeps_fts_rank_order(self, episode_repo, sample_feed, searchable_episodes):
+        episode_ids, _ = episode_repo.search_episodes_fts("rocket", feed_id=sample_feed.id)
+
+        episodes, total = episode_repo.search_by_feed(sample_feed.id, query="rocket")
+
+        assert [e.id for e in episodes] == episode_ids
+        assert total == 3
+
+    def test_status_filter_returns_matching_episodes(
+        self, episode_repo, sample_feed, searchable_episodes
+    ):
+        episodes, total = episode_repo.search_by_feed(
+            sample_feed.id, query="rocket", status=EpisodeStatus.COMPLETED
+        )
+
+        assert [e.id for e in episodes] == [searchable_episodes[1].id]
+        assert total == 1
+
+
+class TestReindexAllEpisodes:
+    def test_rebuilds_index(self, episode_repo, db_conn, searchable_episodes):
+        db_conn.cursor().execute("DELETE FROM episode_search")
+        db_conn.commit()
+
+        count = episode_repo.reindex_all_episodes()
+
+        assert count == len(searchable_episodes)
+        _, total = episode_repo.search_episodes_fts("orbit")
+        assert total == 1
+
+
+def _parsed(guid, title):
+    return ParsedEpisode(
+        guid=guid,
+        title=title,
+        description=None,
+        audio_url=f"https://example.com/{guid}.mp3",
+        duration_seconds=None,
+        published_at=None,
+        transcript_url=None,
+    )
+
+
+class TestCreateMany:
+    def test_skips_known_and_repeated_guids(self, episode_repo, sample_feed, sample_episode):
+        parsed = [
+            _parsed("b", "Second comet"),
+            _parsed(sample_episode.guid, "Already stored"),
+            _parsed("a", "First comet"),
+            _parsed("b", "Repeated comet"),
+        ]
+
+        created = episode_repo.create_many(sample_feed.id, parsed)
+
+        assert [e.guid for e in created] == ["b", "a"]
+        assert created[0].title == "Second comet"
+        assert all(e.status == EpisodeStatus.NEW for e in created)
+        _, total = episode_repo.search_episodes_fts("comet", feed_id=sample_feed.id)
+        assert total == 2
+
+    def test_nothing_new(self, episode_repo, sample_feed, sample_episode):
+        parsed = [_parsed(sample_episode.guid, "Already stored")]
+
+        assert episode_repo.create_many(sample_feed.id, parsed) == []
@@ -67,6 +67,11 @@ class TestGetByStatusOrder:
         with pytest.raises(ValueError):
             repository.get_by_status(EpisodeStatus.COMPLETED, order="created_at; DROP TABLE")
 
+    def test_iter_rejects_unknown_order_before_iteration(self, repo):
+        repository, _ = repo
+        with pytest.raises(ValueError):
+            repository.iter_by_status(EpisodeStatus.COMPLETED, order="created_at; DROP TABLE")
+
 
 class TestGetByStatusFilters:
     """since and feed_id are bound parameters, not interpolated text."""
@@ -91,6 +91,51 @@ class TestJobStateTransitions:
         assert job.status == JobStatus.FAILED
         assert job.attempts == 2
 
+    def test_mark_failed_retry_backoff(self, job_repo, sample_job):
+        """Test that the first retry is scheduled five minutes out."""
+        job_repo.mark_running(sample_job.id)
+        before = datetime.now()
+        job_repo.mark_failed(sample_job.id, "Test error", retry=True)
+
+        job = job_repo.get_by_id(sample_job.id)
+        delay = job.next_retry_at - before
+        assert timedelta(minutes=4) < delay < timedelta(minutes=6)
+        assert job.completed_at is None
+
+    def test_mark_completed_many(self, job_repo, sample_job, sample_episode):
+        """Test completing several jobs in one call."""
+        other = job_repo.create(episode_id=sample_episode.id, job_type=JobType.TRANSCRIBE)
+
+        assert job_repo.mark_completed_many([sample_job.id, other.id]) == 2
+        assert job_repo.mark_completed_many([]) == 0
+
+        for job_id in (sample_job.id, other.id):
+            job = job_repo.get_by_id(job_id)
+            assert job.status == JobStatus.COMPLETED
+            assert job.progress_percent == 100
+
+    def test_mark_failed_many(self, job_repo, sample_job, sample_episode):
+        """Test that a batch failure requeues or fails each job by its attempts."""
+        exhausted = job_repo.create(
+            episode_id=sample_episode.id, job_type=JobType.TRANSCRIBE, max_attempts=1
+        )
+        job_repo.mark_running(sample_job.id)
+        job_repo.mark_running(exhausted.id)
+
+        updated = job_repo.mark_failed_many(
+            [(sample_job.id, "Error A"), (exhausted.id, "Error B")], retry=True
+        )
+
+        assert updated == 2
+        requeued = job_repo.get_by_id(sample_job.id)
+        assert requeued.status == JobStatus.QUEUED
+        assert requeued.error_message == "Error A"
+        assert requeued.next_retry_at is not None
+        failed = job_repo.get_by_id(exhausted.id)
+        assert failed.status == JobStatus.FAILED
+        assert failed.error_message == "Error B"
+        assert failed.completed_at is not None
+
 
 class TestReclaimStaleJobs:
     """Tests for reclaim_stale_jobs to verify the retry limit fix."""
@@ -383,6 +428,30 @@ class TestJobClaiming:
         assert len(jobs) == 1
         assert jobs[0].id == sample_job.id
 
+    def test_claim_batch(self, job_repo, episode_repo, sample_feed):
+        """Test claiming several jobs at once, highest priority first."""
+        jobs = []
+        for i, priority in enumerate([5, 1, 3]):
+            episode = episode_repo.create(
+                feed_id=sample_feed.id,
+                guid=f"batch-{i}",
+                title=f"Batch {i}",
+                audio_url=f"https://example.com/batch{i}.mp3",
+            )
+            jobs.append(job_repo.create(episode.id, JobType.TRANSCRIBE, priority=priority))
+
+        claimed = job_repo.claim_batch(JobType.TRANSCRIBE, "node-123", 2)
+
+        assert [job.id for job in claimed] == [jobs[1].id, jobs[2].id]
+        for job in claimed:
+            assert job.status == JobStatus.RUNNING
+            assert job.assigned_node_id == "node-123"
+            assert job.attempts == 1
+
+        remaining = job_repo.claim_batch(JobType.TRANSCRIBE, "node-456", 2)
+        assert [job.id for job in remaining] == [jobs[0].id]
+        assert job_repo.claim_batch(JobType.TRANSCRIBE, "node-456", 2) == []
+
 
 class TestJobQueries:
     """Tests for job query methods."""
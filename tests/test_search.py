@@ -5,6 +5,7 @@ from pathlib import Path
 
 import pytest
 
+from cast2md.search.parser import parse_transcript_for_index
 from cast2md.search.repository import TranscriptSearchRepository
 
 
@@ -85,6 +86,16 @@ class TestIndexEpisode:
         indexed = search_repo.get_indexed_count()
         assert indexed == 4
 
+    def test_index_segments_matches_index_episode(
+        self, search_repo, sample_episode, transcript_file
+    ):
+        """Test that indexing pre-parsed segments stores the same rows."""
+        segments = parse_transcript_for_index(str(transcript_file))
+        count = search_repo.index_segments(sample_episode.id, segments)
+
+        assert count == 4
+        assert search_repo.get_segments(sample_episode.id) == segments
+
 
 class TestSearchBasic:
     """Tests for basic search functionality."""
@@ -295,3 +306,7 @@ class TestGetIndexedCount:
 
         assert episode.id in indexed
         assert len(indexed) == 1
+
+    def test_count_indexed_episodes(self, search_repo, indexed_episode):
+        """Test counting indexed episodes matches the ID set."""
+        assert search_repo.count_indexed_episodes() == 1
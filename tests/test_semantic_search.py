@@ -203,6 +203,10 @@ class TestEmbeddingIndexing:
         result = search_repo.get_embedded_episodes()
         assert result == set()
 
+    def test_count_embedded_episodes_zero(self, search_repo):
+        """Test count_embedded_episodes returns 0 initially."""
+        assert search_repo.count_embedded_episodes() == 0
+
     def test_get_embedding_count_zero(self, search_repo):
         """Test get_embedding_count returns 0 initially."""
         result = search_repo.get_embedding_count()
@@ -1,6 +1,11 @@
 """Tests for settings configuration and source detection."""
 
+import time
+from pathlib import Path
+
+from cast2md.config import settings as settings_module
 from cast2md.config.settings import (
+    _COERCERS,
     _DEFAULTS,
     NODE_SPECIFIC_SETTINGS,
     get_setting_source,
@@ -79,3 +84,43 @@ class TestDefaults:
         assert _DEFAULTS["whisper_device"] == "auto"
         assert _DEFAULTS["whisper_compute_type"] == "int8"
         assert _DEFAULTS["whisper_backend"] == "auto"
+
+
+class TestCoercers:
+    """Tests for the _COERCERS table used to apply DB overrides."""
+
+    def test_bool_setting_parses_strings(self):
+        """Bool settings should parse 'false' rather than going through int()."""
+        assert _COERCERS["ntfy_enabled"]("true") is True
+        assert _COERCERS["ntfy_enabled"]("false") is False
+
+    def test_int_and_path_settings(self):
+        """Int and Path settings should be converted to their field types."""
+        assert _COERCERS["stuck_threshold_minutes"]("60") == 60
+        assert _COERCERS["storage_path"]("/mnt/podcasts") == Path("/mnt/podcasts")
+
+    def test_literal_setting_kept_as_string(self):
+        """Literal-typed settings should pass the stored string through."""
+        assert _COERCERS["whisper_device"]("cuda") == "cuda"
+
+
+class TestOverrideCache:
+    """Tests for reusing DB overrides between reloads."""
+
+    def test_recent_read_is_reused(self, monkeypatch):
+        """A read younger than max_age should be returned without querying."""
+        cached = {"whisper_model": "base"}
+        monkeypatch.setattr(settings_module, "_override_cache", (time.monotonic(), cached))
+        assert settings_module._get_db_overrides(max_age=30.0) is cached
+
+    def test_clear_override_cache(self, monkeypatch):
+        """Clearing should drop the cached read."""
+        monkeypatch.setattr(settings_module, "_override_cache", (time.monotonic(), {}))
+        settings_module.clear_override_cache()
+        assert settings_module._override_cache is None
+
+    def test_fresh_cache_reuses_settings(self, monkeypatch):
+        """A reload within max_age should not rebuild the Settings object."""
+        current = settings_module.get_settings()
+        monkeypatch.setattr(settings_module, "_override_cache", (time.monotonic(), {}))
+        assert settings_module.reload_settings(max_age=30.0) is current